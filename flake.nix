@@ -14,7 +14,7 @@
       let
         pkgs = import nixpkgs { inherit system; };
         pythonWithPkgs =
-          pkgs.python3.withPackages (ps: with ps; [ discordpy ruff ]);
+          pkgs.python3.withPackages (ps: with ps; [ discordpy orjson uvloop ruff ]);
         
         appName = "todord";
         appVersion = "0.1.3";
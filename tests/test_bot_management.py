@@ -6,7 +6,7 @@ from pathlib import Path
 # Add the parent directory to sys.path to import the module
 sys.path.append(str(Path(__file__).parent.parent))
 
-from todord import BotManagement, StorageManager
+from todord import APP_NAME, BotManagement, StorageManager
 
 
 class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
@@ -20,10 +20,10 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         self.mock_storage.save = AsyncMock(return_value="test_save.json")
         self.mock_storage.load = AsyncMock(return_value=True)  # Default to successful load
         self.mock_storage.list_saved_files = MagicMock(return_value=["file1.json", "file2.json"])
-        # Mock the filename_pattern with a simple regex that accepts any non-empty string
-        # Detailed pattern testing is in test_storage.py
-        self.mock_storage.filename_pattern = MagicMock()
-        self.mock_storage.filename_pattern.match.side_effect = lambda x: bool(x) # True for non-empty strings
+        self.mock_storage.latest_saved_file = MagicMock(return_value="file2.json")
+        # Use the real filename validation; detailed cases are in test_storage.py
+        self.mock_storage.is_valid_filename.side_effect = StorageManager.is_valid_filename
+        self.valid_filename = f"{APP_NAME}_session_2023-01-01_12-00-00Z.json"
 
         # Create the BotManagement cog
         self.bot_management = BotManagement(self.mock_bot, self.mock_storage)
@@ -57,8 +57,8 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         embed = kwargs["embed"]
         self.assertIn("cleared", embed.description.lower())
 
-        # Assert that save was called
-        self.mock_storage.save.assert_called_once_with(self.mock_ctx)
+        # Assert that a save was scheduled for the channel
+        self.mock_storage.mark_dirty.assert_called_once_with(self.mock_ctx.channel.id)
 
     async def test_clear_tasks_empty(self):
         # Setup an empty channel
@@ -77,8 +77,8 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         embed = kwargs["embed"]
         self.assertIn("no tasks", embed.description.lower())
 
-        # Assert that save was not called
-        self.mock_storage.save.assert_not_called()
+        # Assert that no save was scheduled
+        self.mock_storage.mark_dirty.assert_not_called()
 
     async def test_save_command_success(self):
         # Call the save_command method directly via callback
@@ -125,11 +125,11 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         await self.bot_management.load_command.callback(
             self.bot_management,
             self.mock_ctx,  # type: ignore
-            filename="valid_file.json",
+            filename=self.valid_filename,
         )
 
         # Assert that storage.load was called with the right filename
-        self.mock_storage.load.assert_called_once_with(self.mock_ctx, "valid_file.json")
+        self.mock_storage.load.assert_called_once_with(self.valid_filename)
 
         # Assert that reply was called with success message
         self.mock_ctx.reply.assert_called_once()
@@ -162,7 +162,7 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         await self.bot_management.load_command.callback(
             self.bot_management,
             self.mock_ctx,  # type: ignore
-            filename="invalid_file.json",
+            filename=self.valid_filename,
         )
 
         # Assert that storage.load was called
@@ -175,9 +175,8 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         self.assertIn("failed", embed.description.lower())
 
     async def test_loadlast_command_with_files(self):
-        # Set up mock files
-        mock_files = ["file1.json", "file2.json", "most_recent.json"]
-        self.mock_storage.list_saved_files.return_value = mock_files
+        # Set up the most recent file
+        self.mock_storage.latest_saved_file.return_value = "most_recent.json"
 
         # Call the loadlast_command method directly via callback
         await self.bot_management.loadlast_command.callback(
@@ -185,11 +184,11 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
             self.mock_ctx,  # type: ignore
         )
 
-        # Assert that list_saved_files was called
-        self.mock_storage.list_saved_files.assert_called_once()
+        # Assert that latest_saved_file was called
+        self.mock_storage.latest_saved_file.assert_called_once()
 
         # Assert that load was called with the most recent file
-        self.mock_storage.load.assert_called_once_with(self.mock_ctx, "most_recent.json")
+        self.mock_storage.load.assert_called_once_with("most_recent.json")
 
         # Assert that send was called with success message
         self.mock_ctx.send.assert_called_once()
@@ -199,7 +198,7 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
 
     async def test_loadlast_command_no_files(self):
         # Set up mock to return no files
-        self.mock_storage.list_saved_files.return_value = []
+        self.mock_storage.latest_saved_file.return_value = None
 
         # Call the loadlast_command method directly via callback
         await self.bot_management.loadlast_command.callback(
@@ -218,9 +217,8 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         self.mock_storage.load.assert_not_called()
 
     async def test_loadlast_command_load_failure(self):
-        # Set up mock files
-        mock_files = ["file1.json", "file2.json"]
-        self.mock_storage.list_saved_files.return_value = mock_files
+        # Set up the most recent file
+        self.mock_storage.latest_saved_file.return_value = "file2.json"
         # Make load return failure
         self.mock_storage.load.return_value = False
 
@@ -236,6 +234,24 @@ class TestBotManagementCommands(unittest.IsolatedAsyncioTestCase):
         embed = kwargs["embed"]
         self.assertIn("failed", embed.description.lower())
 
+    async def test_load_last_state(self):
+        send = AsyncMock()
+        self.mock_storage.latest_saved_file.return_value = "most_recent.json"
+
+        # Used without a command context by the startup auto-load
+        loaded = await self.bot_management.load_last_state(send, "todord_bot")
+
+        self.assertEqual(loaded, "most_recent.json")
+        embed = send.call_args.kwargs["embed"]
+        self.assertIn("most_recent.json", embed.description)
+        self.assertEqual(embed.footer.text, "Requested by todord_bot")
+
+        # Nothing loaded: no filename is returned
+        self.mock_storage.load.return_value = False
+        self.assertIsNone(await self.bot_management.load_last_state(send, "todord_bot"))
+        self.mock_storage.latest_saved_file.return_value = None
+        self.assertIsNone(await self.bot_management.load_last_state(send, "todord_bot"))
+
     async def test_list_files_command_with_files(self):
         # Set up mock files
         mock_files = ["file1.json", "file2.json"]
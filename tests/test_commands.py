@@ -1,12 +1,17 @@
 import unittest
 from unittest.mock import MagicMock, AsyncMock
 import sys
+import shutil
+import tempfile
 from pathlib import Path
 
+import discord
+import orjson
+
 # Add the parent directory to sys.path to import the module
 sys.path.append(str(Path(__file__).parent.parent))
 
-from todord import TodoList, StorageManager
+from todord import BotManagement, TodoList, StorageManager, Task
 
 
 class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
@@ -18,6 +23,7 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         self.mock_storage = MagicMock(spec=StorageManager)
         self.mock_storage.todo_lists = {}
         self.mock_storage.save = AsyncMock(return_value="test_save.json")
+        self.mock_storage.next_task_id.return_value = 0
 
         # Create the TodoList cog
         self.todo_list = TodoList(self.mock_bot, self.mock_storage)
@@ -45,12 +51,14 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(tasks), 1)
         self.assertEqual(tasks[0].title, "Test Task")
         self.assertEqual(tasks[0].status, "pending")
+        self.assertEqual(tasks[0].id, 0)
+        self.mock_storage.next_task_id.assert_called_once_with(self.mock_ctx.channel.id)
 
         # Assert that the reply method was called
         self.mock_ctx.reply.assert_called_once()
 
-        # Assert that save was called
-        self.mock_storage.save.assert_called_once_with(self.mock_ctx)
+        # Assert that a save was scheduled for the channel
+        self.mock_storage.mark_dirty.assert_called_once_with(self.mock_ctx.channel.id)
 
     async def test_list_tasks_empty(self):
         # Ensure the list is empty
@@ -103,6 +111,7 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         # Check that both tasks are in the description
         self.assertIn("Task 1", embed.description)
         self.assertIn("Task 2", embed.description)
+        self.assertEqual(len(embed.description.splitlines()), 2)
 
     async def test_done_task(self):
         # Add a mock task
@@ -130,8 +139,8 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         # Assert that the reply was called
         self.mock_ctx.reply.assert_called_once()
 
-        # Assert that save was called
-        self.mock_storage.save.assert_called_once_with(self.mock_ctx)
+        # Assert that a save was scheduled for the channel
+        self.mock_storage.mark_dirty.assert_called_once_with(self.mock_ctx.channel.id)
 
     async def test_close_task(self):
         # Add a mock task
@@ -158,8 +167,8 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         # Assert that the reply method was called
         self.mock_ctx.reply.assert_called_once()
 
-        # Assert that save was called
-        self.mock_storage.save.assert_called_once_with(self.mock_ctx)
+        # Assert that a save was scheduled for the channel
+        self.mock_storage.mark_dirty.assert_called_once_with(self.mock_ctx.channel.id)
 
     async def test_log_task(self):
         # Add a mock task
@@ -184,8 +193,8 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         # Assert that the reply method was called
         self.mock_ctx.reply.assert_called_once()
 
-        # Assert that save was called
-        self.mock_storage.save.assert_called_once_with(self.mock_ctx)
+        # Assert that a save was scheduled for the channel
+        self.mock_storage.mark_dirty.assert_called_once_with(self.mock_ctx.channel.id)
 
     async def test_details_task(self):
         # Add a mock task
@@ -236,8 +245,8 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         # Assert that the reply method was called
         self.mock_ctx.reply.assert_called_once()
 
-        # Assert that save was called
-        self.mock_storage.save.assert_called_once_with(self.mock_ctx)
+        # Assert that a save was scheduled for the channel
+        self.mock_storage.mark_dirty.assert_called_once_with(self.mock_ctx.channel.id)
 
     async def test_invalid_task_number(self):
         # Add a mock task
@@ -260,6 +269,72 @@ class TestTodoListCommands(unittest.IsolatedAsyncioTestCase):
         embed = kwargs["embed"]
         self.assertIn("invalid task number", embed.description.lower())
 
+    async def test_log_task_long_log_fits_embed(self):
+        """Test that a very long log still produces a valid embed."""
+        channel_id = self.mock_ctx.channel.id
+        task = Task(self.mock_ctx, 0, "Test Task", "pending")
+        self.mock_storage.todo_lists[channel_id] = [task]
+
+        await self.todo_list.log_task.callback(
+            self.todo_list, self.mock_ctx, task_number=1, log="x" * 4000  # type: ignore
+        )
+
+        _, kwargs = self.mock_ctx.reply.call_args
+        description = kwargs["embed"].description
+        self.assertLessEqual(len(description), 4096)
+        self.assertIn("Current Task Details", description)
+        self.assertEqual(task.logs, ["x" * 4000])
+
+    async def test_change_is_saved_when_reply_fails(self):
+        """Test that a change is still saved when the reply can't be sent."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        storage = StorageManager(temp_dir, "test_session")
+        todo_list = TodoList(self.mock_bot, storage)
+
+        await todo_list.add_task.callback(todo_list, self.mock_ctx, task="Test Task")  # type: ignore
+        await storage.save()
+
+        self.mock_ctx.reply.side_effect = discord.HTTPException(
+            MagicMock(status=403, reason="Forbidden"), "Missing Permissions"
+        )
+        with self.assertRaises(discord.HTTPException):
+            await todo_list.log_task.callback(
+                todo_list, self.mock_ctx, task_number=1, log="Progress"  # type: ignore
+            )
+
+        filename = await storage.save()
+        data = orjson.loads((Path(temp_dir) / filename).read_bytes())
+        self.assertEqual(data[str(self.mock_ctx.channel.id)][0]["logs"], ["Progress"])
+
+    async def test_every_change_reaches_the_next_save(self):
+        """Test that each command marks its changes for the cached encoding."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        storage = StorageManager(temp_dir, "test_session")
+        todo_list = TodoList(self.mock_bot, storage)
+        bot_management = BotManagement(self.mock_bot, storage)
+
+        commands = [
+            (todo_list, todo_list.add_task, {"task": "First"}),
+            (todo_list, todo_list.add_task, {"task": "Second"}),
+            (todo_list, todo_list.log_task, {"task_number": 1, "log": "Progress"}),
+            (todo_list, todo_list.edit_task, {"task_number": 2, "new_title": "Renamed"}),
+            (todo_list, todo_list.done_task, {"task_number": 1}),
+            (todo_list, todo_list.close_task, {"task_number": 1}),
+            (todo_list, todo_list.add_task, {"task": "Third"}),
+            (bot_management, bot_management.clear_tasks, {}),
+        ]
+        for cog, command, kwargs in commands:
+            with self.subTest(command=command.name, **kwargs):
+                await command.callback(cog, self.mock_ctx, **kwargs)  # type: ignore
+                filename = await storage.save()
+                expected = orjson.dumps(
+                    storage.todo_lists,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+                self.assertEqual((Path(temp_dir) / filename).read_bytes(), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,18 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
 # Add the parent directory to sys.path to import the module
 sys.path.append(str(Path(__file__).parent.parent))
 
-from todord import ConnectionMonitor
+from todord import (
+    ConnectionMonitor,
+    handle_connection_error,
+    handle_connection_failure,
+)
 
 
 class TestConnectionMonitor(unittest.TestCase):
@@ -64,13 +69,15 @@ class TestConnectionMonitor(unittest.TestCase):
         self.assertEqual(self.monitor.failure_types, {"TestError": 1})
         self.assertEqual(self.monitor.first_failure_time, now)
         self.assertEqual(self.monitor.last_failure_time, now)
+        self.assertEqual(self.monitor.first_failure_mono, self.monitor.last_failure_mono)
         
         # Verify return value (shouldn't trigger exit yet)
         self.assertFalse(result)
         
         # Verify log message
         mock_logger_warning.assert_called_once()
-        message = mock_logger_warning.call_args[0][0]
+        args = mock_logger_warning.call_args[0]
+        message = args[0] % args[1:]
         self.assertIn("Connection failure #1: TestError", message)
 
     @patch("todord.datetime")
@@ -83,6 +90,7 @@ class TestConnectionMonitor(unittest.TestCase):
         self.monitor.total_failures = 1
         self.monitor.failure_types = {"TestError": 1}
         self.monitor.first_failure_time = first_time
+        self.monitor.first_failure_mono = time.monotonic()
         
         # Mock the datetime.now() call for the second failure
         second_time = datetime(2023, 1, 1, 12, 0, 30)  # 30 seconds later
@@ -112,6 +120,7 @@ class TestConnectionMonitor(unittest.TestCase):
         self.monitor.consecutive_failures = 2
         self.monitor.total_failures = 2
         self.monitor.failure_types = {"TestError": 2}
+        self.monitor.first_failure_mono = time.monotonic()
         
         # Call the method for the third failure (hitting max retries)
         result = self.monitor.connection_failed("TestError")
@@ -139,6 +148,7 @@ class TestConnectionMonitor(unittest.TestCase):
         mock_datetime.now.return_value = now
         self.monitor.consecutive_failures = 1
         self.monitor.total_failures = 1
+        self.monitor.first_failure_mono = time.monotonic()
         
         # Call the method with a critical error
         result = self.monitor.connection_failed("ConnectionClosed")
@@ -184,5 +194,32 @@ class TestConnectionMonitor(unittest.TestCase):
         self.assertIn("OtherError: 2", report)
 
 
+
+class TestConnectionErrorHandling(unittest.TestCase):
+    def setUp(self):
+        self.monitor = ConnectionMonitor(max_retries=2)
+
+    @patch("todord.logger")
+    def test_handle_connection_error_ignores_other_errors(self, _mock_logger):
+        """Test that non-connection errors are not counted as failures."""
+        handle_connection_error(self.monitor, ValueError("not a connection error"))
+        handle_connection_error(self.monitor, None)
+        self.assertEqual(self.monitor.total_failures, 0)
+
+    @patch("todord.logger")
+    def test_handle_connection_error_records_failure(self, _mock_logger):
+        """Test that connection errors are recorded by type name."""
+        handle_connection_error(self.monitor, TimeoutError("timed out"))
+        self.assertEqual(self.monitor.failure_types, {"TimeoutError": 1})
+
+    @patch("todord.logger")
+    def test_handle_connection_failure_exits_at_threshold(self, mock_logger):
+        """Test that reaching the failure threshold exits the process."""
+        handle_connection_failure(self.monitor, "TestError")
+        with self.assertRaises(SystemExit):
+            handle_connection_failure(self.monitor, "TestError", "Giving up")
+        mock_logger.critical.assert_any_call("Giving up")
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
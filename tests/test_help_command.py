@@ -7,11 +7,13 @@ from pathlib import Path
 # Add the parent directory to sys.path to import the module
 sys.path.append(str(Path(__file__).parent.parent))
 
-from todord import CustomHelpCommand
+from todord import CustomHelpCommand, _help_cache
 
 
 class TestCustomHelpCommand(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
+        _help_cache.clear()
+
         # Create the CustomHelpCommand instance
         self.help_command = CustomHelpCommand()
         
@@ -70,12 +72,42 @@ class TestCustomHelpCommand(unittest.IsolatedAsyncioTestCase):
                 self.assertIn("!test", field.value)
                 self.assertIn("!t", field.value)
                 self.assertIn("!other", field.value)
+                self.assertIn("**`!test`\t`!t`**", field.value)
+                self.assertIn("> Usage: `!test <arg>`", field.value)
+                self.assertIn("> Usage: `!other`", field.value)
         
         self.assertTrue(found_cog_field, "Cog field not found in embed")
         
         # Verify footer has hint about command help
         self.assertIn("Type !help <command>", embed.footer.text)
 
+    async def test_send_bot_help_cached(self):
+        """Test that the help embed is reused for the same visible commands."""
+        mock_cog = MagicMock()
+        mock_cog.qualified_name = "TestCog"
+        mock_command = MagicMock()
+        mock_command.name = "test"
+        mock_command.qualified_name = "test"
+        mock_command.aliases = []
+        mock_command.signature = ""
+        self.help_command.filter_commands = AsyncMock(return_value=[mock_command])
+        mapping = {mock_cog: [mock_command]}
+
+        await self.help_command.send_bot_help(mapping)
+        await self.help_command.send_bot_help(mapping)
+
+        first, second = self.mock_destination.send.call_args_list
+        self.assertIs(first.kwargs["embed"], second.kwargs["embed"])
+
+        # Commands are still filtered on every call
+        self.assertEqual(self.help_command.filter_commands.await_count, 2)
+
+        # Once the entry expires, the embed is rebuilt
+        with patch("todord.time.monotonic", return_value=float("inf")):
+            await self.help_command.send_bot_help(mapping)
+        third = self.mock_destination.send.call_args_list[2]
+        self.assertIsNot(third.kwargs["embed"], first.kwargs["embed"])
+
     async def test_send_command_help(self):
         """Test sending help for a specific command."""
         # Create a mock command
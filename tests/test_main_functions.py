@@ -1,9 +1,11 @@
 import unittest
 from unittest.mock import patch, AsyncMock, MagicMock
 import sys
-import argparse
+import logging
+import logging.handlers
 import os
 import asyncio
+import tempfile
 from pathlib import Path
 
 # Add the parent directory to sys.path to import the module
@@ -12,6 +14,18 @@ sys.path.append(str(Path(__file__).parent.parent))
 import todord
 
 
+def make_channel(name="general", send=None, send_messages=True, embed_links=True):
+    """Create a mock text channel with the given send and bot permissions."""
+    channel = MagicMock()
+    channel.name = name
+    channel.guild.name = "guild"
+    channel.send = send if send is not None else AsyncMock()
+    channel.permissions_for.return_value = MagicMock(
+        send_messages=send_messages, embed_links=embed_links
+    )
+    return channel
+
+
 class TestMainFunctions(unittest.TestCase):
     def test_parse_args_defaults(self):
         """Test that parse_args sets default values correctly."""
@@ -21,6 +35,8 @@ class TestMainFunctions(unittest.TestCase):
             self.assertIsNone(args.token)
             self.assertFalse(args.debug)
             self.assertEqual(args.max_retries, 3)
+            self.assertEqual(args.autoload_timeout, 30.0)
+            self.assertEqual(args.save_delay, 1.0)
 
     def test_parse_args_custom(self):
         """Test that parse_args handles custom arguments correctly."""
@@ -29,13 +45,30 @@ class TestMainFunctions(unittest.TestCase):
             '--data_dir', '/custom/data',
             '--token', 'test_token',
             '--debug',
-            '--max_retries', '5'
+            '--max_retries', '5',
+            '--autoload_timeout', '10',
+            '--save_delay', '5'
         ]):
             args = todord.parse_args()
             self.assertEqual(args.data_dir, "/custom/data")
             self.assertEqual(args.token, "test_token")
             self.assertTrue(args.debug)
             self.assertEqual(args.max_retries, 5)
+            self.assertEqual(args.autoload_timeout, 10.0)
+            self.assertEqual(args.save_delay, 5.0)
+
+    def test_parse_args_falls_back_to_argparse(self):
+        """Test that forms outside the fast path are still accepted."""
+        args = todord.parse_args(['--data_dir=/custom/data', '--max_retries', '-1', '--save_delay=0.5'])
+        self.assertEqual(args.data_dir, "/custom/data")
+        self.assertEqual(args.save_delay, 0.5)
+        self.assertEqual(args.max_retries, -1)
+
+    def test_parse_args_rejects_unknown_option(self):
+        """Test that unknown options are reported by argparse."""
+        with patch('sys.stderr'):
+            with self.assertRaises(SystemExit):
+                todord.parse_args(['--unknown'])
 
     def test_get_token_from_args(self):
         """Test getting token from command line arguments."""
@@ -63,6 +96,230 @@ class TestMainFunctions(unittest.TestCase):
             token = todord.get_token(args)
             self.assertIsNone(token)
 
+    def test_start_log_listener(self):
+        """Test that log records are written through the queue listener."""
+        root = logging.getLogger()
+        original_handlers = root.handlers[:]
+        records = []
+        capture = logging.Handler()
+        capture.emit = records.append
+        capture.addFilter(todord.session_log_filter)
+        root.handlers = [capture]
+        try:
+            with patch.object(todord.session_log_filter, 'session_id', 'abcd1234'):
+                listener = todord.start_log_listener()
+                self.assertIsInstance(root.handlers[0], logging.handlers.QueueHandler)
+                todord.logger.warning("Saved %s", "file.json")
+                listener.stop()
+        finally:
+            root.handlers = original_handlers
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].getMessage(), "Saved file.json")
+        self.assertEqual(records[0].session_id, 'abcd1234')
+        # Stamped once on the logging thread, not again by the listener
+        self.assertNotIn(todord.session_log_filter, capture.filters)
+
+
+class TestAnnouncements(unittest.IsolatedAsyncioTestCase):
+    async def test_send_announcement_to_all_channels(self):
+        ok = make_channel("ok", AsyncMock())
+        failing = make_channel("failing", AsyncMock(side_effect=Exception("boom")))
+        other = make_channel("other", AsyncMock())
+        guild1 = MagicMock(text_channels=[ok, failing])
+        guild2 = MagicMock(text_channels=[other])
+        bot = MagicMock(guilds=[guild1, guild2])
+
+        with patch("todord.logger.warning") as mock_warning:
+            await todord.send_announcement_to_all_channels(
+                bot, "Title", "Description", todord.discord.Color.green()
+            )
+
+        # A failing channel doesn't stop the others, and the embed is shared
+        embeds = [c.send.call_args.kwargs["embed"] for c in (ok, failing, other)]
+        self.assertTrue(all(embed is embeds[0] for embed in embeds))
+        self.assertEqual(embeds[0].title, "Title")
+        mock_warning.assert_called_once()
+        self.assertIn("failing", mock_warning.call_args.args[0])
+
+    async def test_send_announcement_retries_rate_limits(self):
+        response = MagicMock(status=429, reason="Too Many Requests")
+        rate_limited = todord.discord.HTTPException(response, "rate limited")
+        channel = make_channel("busy", AsyncMock(side_effect=[rate_limited, None]))
+        bot = MagicMock(guilds=[MagicMock(text_channels=[channel])])
+
+        with patch("todord.asyncio.sleep", new=AsyncMock()) as mock_sleep, patch(
+            "todord.logger.warning"
+        ) as mock_warning:
+            await todord.send_announcement_to_all_channels(
+                bot, "Title", "Description", todord.discord.Color.green()
+            )
+
+        self.assertEqual(channel.send.await_count, 2)
+        mock_sleep.assert_awaited_once()
+        mock_warning.assert_not_called()
+
+    async def test_send_announcement_gives_up_on_other_errors(self):
+        response = MagicMock(status=403, reason="Forbidden")
+        forbidden = todord.discord.HTTPException(response, "missing access")
+        channel = make_channel("private", AsyncMock(side_effect=forbidden))
+        bot = MagicMock(guilds=[MagicMock(text_channels=[channel])])
+
+        with patch("todord.logger.warning") as mock_warning:
+            await todord.send_announcement_to_all_channels(
+                bot, "Title", "Description", todord.discord.Color.green()
+            )
+
+        channel.send.assert_awaited_once()
+        mock_warning.assert_called_once()
+
+
+class TestFindFirstAvailableChannel(unittest.TestCase):
+    def test_returns_first_channel_with_permissions(self):
+        read_only = make_channel(send_messages=False)
+        no_embeds = make_channel(send_messages=True, embed_links=False)
+        writable = make_channel(send_messages=True)
+        guild = MagicMock(text_channels=[read_only, no_embeds, writable])
+        bot = MagicMock(guilds=[guild])
+
+        self.assertIs(todord.find_first_available_channel(bot), writable)
+        read_only.permissions_for.assert_called_once_with(guild.me)
+        # Nothing is sent to probe the channels
+        read_only.send.assert_not_called()
+
+    def test_returns_none_without_permissions(self):
+        guild = MagicMock(text_channels=[make_channel(send_messages=False)])
+        self.assertIsNone(todord.find_first_available_channel(MagicMock(guilds=[guild])))
+
+
+class TestMainRetries(unittest.IsolatedAsyncioTestCase):
+    async def run_main(self, start_side_effect, max_retries=3):
+        bot = MagicMock()
+        bot.start = AsyncMock(side_effect=start_side_effect)
+        bot.close = AsyncMock()
+        storage = MagicMock()
+        storage.close = AsyncMock()
+        args = todord.Args(token="test_token", max_retries=max_retries)
+
+        with patch("todord.parse_args", return_value=args), patch(
+            "todord.setup_bot", new=AsyncMock(return_value=(bot, storage))
+        ), patch("todord.asyncio.sleep", new=AsyncMock()) as mock_sleep, patch(
+            "todord.logger"
+        ):
+            # Kept for tests where main() exits before returning them
+            self.bot, self.mock_sleep = bot, mock_sleep
+            try:
+                await todord.main()
+            finally:
+                storage.close.assert_awaited_once()
+        return bot, mock_sleep
+
+    async def test_main_retries_transient_start_errors(self):
+        bot, mock_sleep = await self.run_main([TimeoutError(), None])
+
+        self.assertEqual(bot.start.await_count, 2)
+        mock_sleep.assert_awaited_once()
+        # The client is closed and reset before starting again
+        bot.close.assert_awaited_once()
+        bot.clear.assert_called_once()
+
+    async def test_main_exits_after_max_retries(self):
+        with self.assertRaises(SystemExit):
+            await self.run_main([TimeoutError()] * 5, max_retries=2)
+
+    async def test_main_retries_server_errors(self):
+        unavailable = todord.discord.HTTPException(
+            MagicMock(status=503, reason="Service Unavailable"), "unavailable"
+        )
+        bot, mock_sleep = await self.run_main([unavailable, None])
+
+        self.assertEqual(bot.start.await_count, 2)
+        mock_sleep.assert_awaited_once()
+
+    async def test_main_exits_on_permanent_errors(self):
+        forbidden = todord.discord.HTTPException(
+            MagicMock(status=403, reason="Forbidden"), "missing access"
+        )
+        for error in (todord.discord.LoginFailure("bad token"), forbidden):
+            with self.subTest(error=type(error).__name__):
+                with self.assertRaises(SystemExit):
+                    await self.run_main([error, None])
+                # Not retried
+                self.bot.start.assert_awaited_once()
+                self.mock_sleep.assert_not_awaited()
+
+    async def test_main_exits_on_other_errors(self):
+        with self.assertRaises(SystemExit):
+            await self.run_main([ValueError("bad")])
+
+
+class TestSetupBot(unittest.IsolatedAsyncioTestCase):
+    async def test_setup_hook_registers_cogs_once(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            args = todord.Args(data_dir=data_dir)
+            bot, storage = await todord.setup_bot(
+                args, "test_token", "session", todord.ConnectionMonitor()
+            )
+            # Not logged in, so the startup task finds no user and returns
+            bot.wait_until_ready = AsyncMock()
+            try:
+                # Nothing is registered until the bot logs in
+                self.assertIsNone(bot.get_cog("TodoList"))
+
+                await bot.setup_hook()
+                await bot.setup_hook()  # e.g. a retried start
+
+                self.assertIsNotNone(bot.get_cog("TodoList"))
+                self.assertIsNotNone(bot.get_cog("BotManagement"))
+                self.assertIsNotNone(bot.get_command("add"))
+                self.assertIsNotNone(storage._writer_task)
+            finally:
+                await storage.close()
+
+    async def test_state_is_restored_only_once(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            args = todord.Args(data_dir=data_dir)
+            bot, storage = await todord.setup_bot(
+                args, "test_token", "session", todord.ConnectionMonitor()
+            )
+            await storage.save()
+            bot._connection.user = MagicMock()
+            bot.wait_until_ready = AsyncMock()
+            channel = make_channel()
+
+            with patch.object(storage, "load", wraps=storage.load) as mock_load, patch(
+                "todord.find_first_available_channel", return_value=channel
+            ), patch(
+                "todord.send_announcement_to_all_channels", new=AsyncMock()
+            ) as mock_announce:
+                try:
+                    await bot.setup_hook()
+                    await bot.setup_hook()  # e.g. a retried start
+                    await bot.on_ready()
+                    await bot.on_ready()  # e.g. after a reconnect that can't resume
+
+                    # Let the startup task finish
+                    startup_tasks = asyncio.all_tasks() - {
+                        asyncio.current_task(),
+                        storage._writer_task,
+                    }
+                    await asyncio.gather(*startup_tasks)
+                finally:
+                    await storage.close()
+
+            mock_load.assert_awaited_once()
+            mock_announce.assert_awaited_once()
+
+    async def test_message_logging_only_with_debug(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            for debug in (False, True):
+                with self.subTest(debug=debug):
+                    args = todord.Args(data_dir=data_dir, debug=debug)
+                    bot, _ = await todord.setup_bot(
+                        args, "test_token", "session", todord.ConnectionMonitor()
+                    )
+                    self.assertEqual(bool(bot.extra_events.get("on_message")), debug)
+
 
 # Create a simplified TestMainFunction class that avoids the complex async mocking
 class TestSimplifiedMainFunction(unittest.TestCase):
@@ -74,6 +331,13 @@ class TestSimplifiedMainFunction(unittest.TestCase):
         """Simple test that verifies get_token exists."""
         self.assertTrue(callable(todord.get_token))
         
+    def test_create_bot(self):
+        """Test that create_bot configures prefix, intents and help command."""
+        bot = todord.create_bot()
+        self.assertEqual(bot.command_prefix, "!")
+        self.assertTrue(bot.intents.message_content)
+        self.assertIsInstance(bot.help_command, todord.CustomHelpCommand)
+
     def test_main_exists(self):
         """Simple test that verifies main exists and is async."""
         self.assertTrue(callable(todord.main))
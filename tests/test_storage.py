@@ -1,11 +1,20 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import os
 import sys
 import tempfile
 import json
+from datetime import datetime, timezone
+import orjson
 from pathlib import Path
 import shutil
 
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 import todord
 
 # Add the parent directory to sys.path to import the module
@@ -64,10 +73,15 @@ class TestStorageManager(unittest.IsolatedAsyncioTestCase):
         )  # Channel ID is converted to string in JSON
         self.assertEqual(len(data[str(channel_id)]), 1)  # One task in the channel
         self.assertEqual(data[str(channel_id)][0]["title"], "Test Task")
+        # The save format keeps the original task field order
+        self.assertEqual(
+            list(data[str(channel_id)][0]),
+            ["id", "title", "status", "logs", "internal_logs", "creator"],
+        )
 
         # Clear the todo lists and load
         self.storage.todo_lists = {}
-        success = await self.storage.load(self.mock_ctx, expected_filename)
+        success = await self.storage.load(expected_filename)
 
         # Verify load was successful
         self.assertTrue(success)
@@ -75,6 +89,212 @@ class TestStorageManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(self.storage.todo_lists[channel_id]), 1)
         self.assertEqual(self.storage.todo_lists[channel_id][0].title, "Test Task")
 
+    async def test_load_upgrades_legacy_internal_logs(self):
+        filename = f"{todord.APP_NAME}_{self.session_id}_2023-01-01_12-00-00Z.json"
+        legacy_task = {
+            "id": 0,
+            "title": "Old Task",
+            "status": "pending",
+            "logs": [],
+            "internal_logs": [
+                ["2023-01-01 12:00:00", "old_user", "task_created"],
+                ["2023-01-01 12:01:00", "old_user", "task_log_added: 'a: b'"],
+            ],
+            "creator": "old_user",
+        }
+        (Path(self.temp_dir) / filename).write_bytes(orjson.dumps({"1": [legacy_task]}))
+
+        self.assertTrue(await self.storage.load(filename))
+
+        task = self.storage.todo_lists[1][0]
+        self.assertEqual(
+            task.internal_logs,
+            [
+                ("2023-01-01 12:00:00", "old_user", "task_created", ""),
+                ("2023-01-01 12:01:00", "old_user", "task_log_added", "'a: b'"),
+            ],
+        )
+        self.assertIn("old_user: Added log 'a: b'", task.show_details())
+
+    async def test_load_saves_pending_changes_first(self):
+        self.storage.todo_lists[1] = [Task(self.mock_ctx, 0, "Saved", "pending")]
+        filename = await self.storage.save()
+
+        # A change still waiting for the background writer
+        self.storage.todo_lists[1].append(Task(self.mock_ctx, 1, "Pending", "pending"))
+        self.storage.mark_dirty(1)
+
+        with patch("todord.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2030, 1, 1, tzinfo=timezone.utc)
+            self.assertTrue(await self.storage.load(filename))
+
+        # The pending change was written to its own file before loading
+        self.assertEqual([task.title for task in self.storage.todo_lists[1]], ["Saved"])
+        pending_file = self.storage.latest_saved_file()
+        self.assertNotEqual(pending_file, filename)
+        data = orjson.loads((Path(self.temp_dir) / pending_file).read_bytes())
+        self.assertEqual([task["title"] for task in data["1"]], ["Saved", "Pending"])
+
+        # Nothing is left for the writer to save
+        self.assertFalse(self.storage._dirty)
+        self.assertEqual(self.storage._encoded_channels, {})
+
+    async def test_load_malformed_file(self):
+        filename = f"{todord.APP_NAME}_{self.session_id}_2023-01-01_12-00-00Z.json"
+        self.storage.todo_lists[1] = [Task(self.mock_ctx, 0, "Kept", "pending")]
+        contents = {
+            "invalid json": b"{not json",
+            "not an object": b"[]",
+            "bad channel id": b'{"abc": []}',
+            "missing field": b'{"1": [{"id": 0}]}',
+            "tasks not a list": b'{"1": 5}',
+        }
+        for case, content in contents.items():
+            with self.subTest(case=case):
+                (Path(self.temp_dir) / filename).write_bytes(content)
+                self.assertFalse(await self.storage.load(filename))
+                # The current state is left untouched
+                self.assertEqual(self.storage.todo_lists[1][0].title, "Kept")
+
+        self.assertFalse(await self.storage.load(filename.replace("2023", "2024")))
+
+    async def test_save_reencodes_only_dirty_channels(self):
+        def full_dump():
+            return orjson.dumps(
+                self.storage.todo_lists,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+
+        self.assertEqual(self.storage._encode_todo_lists(), full_dump())
+
+        self.storage.todo_lists[1] = [Task(self.mock_ctx, 0, "First", "pending")]
+        self.storage.todo_lists[2] = []
+        self.storage.todo_lists[3] = [
+            Task(self.mock_ctx, 0, "Multi\nline", "pending", ["a log"]),
+            Task(self.mock_ctx, 1, "Other", "pending"),
+        ]
+        await self.storage.save()
+        cached = dict(self.storage._encoded_channels)
+
+        # Change one channel; the others are reused from the previous save
+        self.storage.todo_lists[3][1].set_title(self.mock_ctx, "Renamed")
+        self.storage.mark_dirty(3)
+        filename = await self.storage.save()
+
+        self.assertIs(self.storage._encoded_channels[1], cached[1])
+        self.assertIsNot(self.storage._encoded_channels[3], cached[3])
+        self.assertEqual((Path(self.temp_dir) / filename).read_bytes(), full_dump())
+
+        # Removed channels are dropped from the output
+        del self.storage.todo_lists[1]
+        self.assertEqual(self.storage._encode_todo_lists(), full_dump())
+
+    async def test_save_is_atomic(self):
+        self.storage.todo_lists[1] = [Task(self.mock_ctx, 0, "Test Task", "pending")]
+
+        with patch("todord.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                await self.storage.save()
+
+        # Neither a partial save file nor the temporary file is left behind
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [])
+
+        with patch("todord.os.fsync", wraps=os.fsync) as mock_fsync:
+            filename = await self.storage.save()
+            mock_fsync.assert_called_once()
+        self.assertEqual([p.name for p in Path(self.temp_dir).iterdir()], [filename])
+
+    async def test_save_skips_unchanged_state(self):
+        self.storage.todo_lists[1] = [Task(self.mock_ctx, 0, "Test Task", "pending")]
+        first = await self.storage.save()
+
+        # Same content: the previous file is reused instead of writing a new one
+        with patch("todord.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "2099-01-01_00-00-00Z"
+            self.assertEqual(await self.storage.save(), first)
+            self.assertEqual(self.storage.list_saved_files(), [first])
+
+            # Changed content is written to a new file
+            self.storage.todo_lists[1][0].set_status(self.mock_ctx, "done")
+            self.storage.mark_dirty(1)
+            second = await self.storage.save()
+
+        self.assertNotEqual(second, first)
+        self.assertEqual(self.storage.list_saved_files(), [first, second])
+
+    async def test_next_task_id(self):
+        self.assertEqual(self.storage.next_task_id(1), 0)
+        self.assertEqual(self.storage.next_task_id(1), 1)
+        self.assertEqual(self.storage.next_task_id(2), 0)
+
+        # IDs of removed tasks are not handed out again
+        self.storage.todo_lists[1] = []
+        self.assertEqual(self.storage.next_task_id(1), 2)
+
+        # Channels with existing tasks continue after the highest ID
+        self.storage.todo_lists[3] = [Task(self.mock_ctx, 5, "Task", "pending")]
+        self.assertEqual(self.storage.next_task_id(3), 6)
+
+    async def check_save_and_load_with(self, json_module):
+        self.storage.todo_lists[1] = [
+            Task(self.mock_ctx, 0, "Tâche a/b", "pending", ["a log"]),
+            Task(self.mock_ctx, 1, "Other", "pending"),
+        ]
+        self.storage.todo_lists[2] = []
+        expected = self.storage._encode_todo_lists()
+        self.storage._encoded_channels.clear()
+
+        with patch("todord.orjson", None), patch("todord.json_fallback", json_module, create=True):
+            filename = await self.storage.save()
+            # Same bytes as orjson writes, so save files keep a single format
+            self.assertEqual((Path(self.temp_dir) / filename).read_bytes(), expected)
+
+            self.storage.todo_lists = {}
+            self.assertTrue(await self.storage.load(filename))
+
+        self.assertEqual(self.storage.todo_lists[1][0].title, "Tâche a/b")
+
+    async def test_save_and_load_without_orjson(self):
+        # Fall back to the standard library when neither orjson nor ujson exists
+        await self.check_save_and_load_with(json)
+
+    @unittest.skipIf(ujson is None, "ujson is not installed")
+    async def test_save_and_load_with_ujson(self):
+        await self.check_save_and_load_with(ujson)
+
+    async def test_writer_coalesces_changes(self):
+        self.storage.save_delay = 0.01
+        self.storage.save = AsyncMock(return_value="saved.json")
+        self.storage.start_writer()
+
+        # A burst of changes results in a single save
+        for channel_id in (1, 2, 1):
+            self.storage.mark_dirty(channel_id)
+        await asyncio.sleep(0.1)
+        self.storage.save.assert_awaited_once()
+
+        await self.storage.close()
+
+    async def test_close_saves_pending_changes(self):
+        self.storage.todo_lists[1] = [Task(self.mock_ctx, 0, "Test Task", "pending")]
+        self.storage.save_delay = 60
+        self.storage.start_writer()
+        self.storage.mark_dirty(1)
+
+        await self.storage.close()
+
+        self.assertEqual(len(self.storage.list_saved_files()), 1)
+        self.assertEqual(self.storage._dirty, set())
+
+    async def test_save_clears_pending_changes(self):
+        self.storage.mark_dirty(1)
+        await self.storage.save()
+        self.assertEqual(self.storage._dirty, set())
+
+        # Closing with nothing pending doesn't write another file
+        await self.storage.close()
+        self.assertEqual(len(self.storage.list_saved_files()), 1)
+
     async def test_list_saved_files(self):
         # Create some test files with timestamps out of order - update to include 'Z'
         valid_files_unsorted = [
@@ -112,6 +332,64 @@ class TestStorageManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(listed_files), len(expected_sorted_files))
         self.assertEqual(listed_files, expected_sorted_files)
 
+    def test_is_valid_filename(self):
+        valid = f"{todord.APP_NAME}_{self.session_id}_2023-01-01_12-00-00Z.json"
+        cases = {
+            valid: True,
+            f"{todord.APP_NAME}_a_b_2023-01-01_12-00-00Z.json": True,
+            f"{todord.APP_NAME}__2023-01-01_12-00-00Z.json": False,  # Empty session id
+            f"{todord.APP_NAME}_x_2023-01-01_12-00-0Z.json": False,  # Short timestamp
+            f"{todord.APP_NAME}_x_2023-01-01T12-00-00Z.json": False,  # Wrong separator
+            f"{todord.APP_NAME}_x_2023-01-01_12-00-0\u00b2Z.json": False,  # Non-ASCII digit
+            f"{todord.APP_NAME}_x\ny_2023-01-01_12-00-00Z.json": False,  # Newline
+            f"{valid}.bak": False,
+            f"{todord.APP_NAME}_a/../b_2023-01-01_12-00-00Z.json": False,  # Path traversal
+            f"{todord.APP_NAME}_a\\b_2023-01-01_12-00-00Z.json": False,  # Backslash
+            f"{todord.APP_NAME}_a\x00_2023-01-01_12-00-00Z.json": False,  # NUL byte
+        }
+        for name, expected in cases.items():
+            with self.subTest(name=name):
+                self.assertEqual(StorageManager.is_valid_filename(name), expected)
+
+    async def test_latest_saved_file(self):
+        # Save files out of order alongside an invalid file
+        filenames = [
+            f"{todord.APP_NAME}_{self.session_id}_2023-01-02_10-00-00Z.json",
+            f"{todord.APP_NAME}_other_session_2023-01-03_08-00-00Z.json",
+            f"{todord.APP_NAME}_{self.session_id}_2023-01-01_12-00-00Z.json",
+            f"{todord.APP_NAME}_{self.session_id}_2023-01-04_12-00-00Z.txt",
+        ]
+        for filename in filenames:
+            (Path(self.temp_dir) / filename).write_text("{}")
+
+        self.assertEqual(
+            self.storage.latest_saved_file(),
+            f"{todord.APP_NAME}_other_session_2023-01-03_08-00-00Z.json",
+        )
+        self.assertEqual(self.storage.latest_saved_file(), self.storage.list_saved_files()[-1])
+
+    async def test_list_saved_files_skips_directories(self):
+        name = f"{todord.APP_NAME}_{self.session_id}_2023-01-01_12-00-00Z.json"
+        (Path(self.temp_dir) / name).mkdir()
+        self.assertEqual(self.storage.list_saved_files(), [])
+
+    async def test_latest_saved_file_empty(self):
+        self.assertIsNone(self.storage.latest_saved_file())
+
+    async def test_list_saved_files_cache(self):
+        first = f"{todord.APP_NAME}_{self.session_id}_2023-01-01_12-00-00Z.json"
+        (Path(self.temp_dir) / first).write_text("{}")
+        self.assertEqual(self.storage.list_saved_files(), [first])
+
+        # Unchanged directory: the cached listing is reused without a scan
+        with patch("todord.os.scandir") as mock_scandir:
+            self.assertEqual(self.storage.list_saved_files(), [first])
+            mock_scandir.assert_not_called()
+
+        # A save adds a file and invalidates the cache
+        filename = await self.storage.save(self.mock_ctx)
+        self.assertEqual(self.storage.list_saved_files(), [first, filename])
+
     async def test_load_invalid_filename(self):
         """Test that loading fails for filenames with invalid formats."""
         # Update invalid files list relative to the new 'Z' requirement
@@ -141,7 +419,7 @@ class TestStorageManager(unittest.IsolatedAsyncioTestCase):
 
         for filename in invalid_files:
             with self.subTest(filename=filename):
-                success = await self.storage.load(self.mock_ctx, filename)
+                success = await self.storage.load(filename)
                 self.assertFalse(
                     success, f"Load should have failed for invalid filename: {filename}"
                 )
@@ -1,11 +1,15 @@
+import re
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import sys
 from pathlib import Path
 
 # Add the parent directory to sys.path to import the module
 sys.path.append(str(Path(__file__).parent.parent))
 
+import orjson
+
+import todord
 from todord import Task, TaskEvent
 
 
@@ -28,9 +32,32 @@ class TestTask(unittest.TestCase):
 
         # Check that an internal log was created for task creation
         self.assertEqual(len(self.task.internal_logs), 1)
-        _, user, action = self.task.internal_logs[0]
+        _, user, action, details = self.task.internal_logs[0]
         self.assertEqual(user, "test_user")
         self.assertEqual(action, TaskEvent.CREATED)
+        self.assertEqual(details, "")
+
+    def test_task_has_no_instance_dict(self):
+        """Test that tasks use slots instead of a per-instance __dict__."""
+        self.assertFalse(hasattr(self.task, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.task.unknown_attribute = "value"
+
+    def test_from_dict_round_trip(self):
+        """Test that a saved task is rebuilt without a new creation event."""
+        self.task.add_log(self.mock_ctx, "Progress update")
+        data = orjson.loads(orjson.dumps(self.task))
+
+        with patch("todord._now_str") as mock_now:
+            task = Task.from_dict(data)
+            mock_now.assert_not_called()
+
+        self.assertEqual(orjson.dumps(task), orjson.dumps(self.task))
+
+        # Repeated strings from the file share the interned constants
+        self.assertIs(task.status, todord.TaskStatus.PENDING)
+        self.assertIs(task.internal_logs[1][2], TaskEvent.LOG_ADDED)
+        self.assertEqual(task.internal_logs, self.task.internal_logs)
 
     def test_add_log(self):
         """Test adding a log to a task."""
@@ -42,10 +69,21 @@ class TestTask(unittest.TestCase):
 
         # Check that an internal log was created for the log addition
         self.assertEqual(len(self.task.internal_logs), 2)
-        _, user, action = self.task.internal_logs[1]
+        _, user, action, details = self.task.internal_logs[1]
         self.assertEqual(user, "test_user")
-        self.assertTrue(action.startswith(TaskEvent.LOG_ADDED))
-        self.assertTrue("Test log message" in action)
+        self.assertEqual(action, TaskEvent.LOG_ADDED)
+        self.assertTrue("Test log message" in details)
+
+    def test_long_values_truncated_in_history(self):
+        """Test that long logs and titles are shortened in the history."""
+        long_text = "x" * 40
+        self.task.add_log(self.mock_ctx, long_text)
+        self.task.set_title(self.mock_ctx, long_text)
+
+        _, _, _, log_action = self.task.internal_logs[1]
+        _, _, _, title_action = self.task.internal_logs[2]
+        self.assertIn(f"'{'x' * 30}...'", log_action)
+        self.assertIn(f"from 'Test Task' to '{'x' * 30}...'", title_action)
 
     def test_set_status(self):
         """Test changing a task's status."""
@@ -56,10 +94,10 @@ class TestTask(unittest.TestCase):
 
         # Check internal log was added
         self.assertEqual(len(self.task.internal_logs), 2)
-        _, user, action = self.task.internal_logs[1]
+        _, user, action, details = self.task.internal_logs[1]
         self.assertEqual(user, "test_user")
-        self.assertTrue(action.startswith(TaskEvent.STATUS_UPDATED))
-        self.assertTrue("from 'pending' to 'done'" in action)
+        self.assertEqual(action, TaskEvent.STATUS_UPDATED)
+        self.assertTrue("from 'pending' to 'done'" in details)
 
     def test_set_title(self):
         """Test changing a task's title."""
@@ -70,9 +108,21 @@ class TestTask(unittest.TestCase):
 
         # Check internal log was added
         self.assertEqual(len(self.task.internal_logs), 2)
-        _, user, action = self.task.internal_logs[1]
+        _, user, action, _ = self.task.internal_logs[1]
         self.assertEqual(user, "test_user")
-        self.assertTrue(action.startswith(TaskEvent.TITLE_EDITED))
+        self.assertEqual(action, TaskEvent.TITLE_EDITED)
+
+    def test_internal_log_timestamp_cached_per_second(self):
+        """Test that log timestamps are formatted once per second."""
+        with patch("todord.time.time", return_value=1700000000.2):
+            first = todord._now_str()
+        with patch("todord.time.time", return_value=1700000000.9):
+            self.assertIs(todord._now_str(), first)
+        with patch("todord.time.time", return_value=1700000001.0):
+            second = todord._now_str()
+
+        self.assertNotEqual(first, second)
+        self.assertRegex(second, r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
 
     def test_show_details(self):
         """Test the formatted details output."""
@@ -89,6 +139,40 @@ class TestTask(unittest.TestCase):
         self.assertTrue("Progress update" in details)
         self.assertTrue("History:" in details)
 
+    def test_show_details_truncated(self):
+        """Test that long details are cut off with a notice."""
+        for i in range(200):
+            self.task.add_log(self.mock_ctx, f"Log entry number {i}")
+
+        details = self.task.show_details()
+        self.assertLessEqual(len(details), 4096)
+        self.assertIn("1. Log entry number 0", details)
+        self.assertRegex(details.splitlines()[-1], r"^\.\.\. \(\d+ more entries truncated\)$")
+
+        # Every entry is either shown or counted as truncated
+        lines = details.splitlines()
+        shown = sum(1 for line in lines if re.match(r"^(\d+\. |• )", line))
+        remaining = int(re.search(r"\((\d+) more", lines[-1]).group(1))
+        self.assertEqual(shown + remaining, len(self.task.logs) + len(self.task.internal_logs))
+
+        # Short details are not truncated
+        self.assertNotIn("truncated", self.task.show_details(max_length=100000))
+
+    def test_show_details_history_actions(self):
+        """Test that history entries are rendered as readable text."""
+        self.task.add_log(self.mock_ctx, "Uses {braces}")
+        self.task.set_status(self.mock_ctx, "done")
+        self.task.internal_logs.append(("2023-01-01 12:00:00", "bot", "custom", "x"))
+
+        history = self.task.show_details().split("**History:**\n", 1)[1].splitlines()
+
+        self.assertTrue(history[0].endswith("test_user: Created task"))
+        self.assertTrue(history[1].endswith("test_user: Added log 'Uses {braces}'"))
+        self.assertTrue(
+            history[2].endswith("test_user: Updated status from 'pending' to 'done'")
+        )
+        self.assertEqual(history[3], "• 2023-01-01 12:00:00 - bot: custom")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,36 +4,93 @@
 This script implements a Discord bot that helps manage to-do lists in Discord channels.
 """
 
-import argparse
-import json
+import hashlib
 import logging
+import logging.handlers
 import os
+import queue
+import random
+import secrets
 import sys
-import uuid
+import time
 import asyncio
+from collections import Counter
+from dataclasses import InitVar, dataclass, field, fields
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
-import re
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import discord
 from discord.ext import commands
 from discord import errors as discord_errors
 from aiohttp import client_exceptions
 
+# Prefer orjson for save files, then ujson, and only then the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    try:
+        import ujson as json_fallback
+    except ImportError:
+        import json as json_fallback
+
 # Application information from environment variables
 APP_NAME = os.getenv("TODORD_APP_NAME", "todord")
 APP_VERSION = os.getenv("TODORD_APP_VERSION", "dev")
 
+
+class SessionLogFilter(logging.Filter):
+    """Adds the current session ID to every log record."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.session_id = "-"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session_id = self.session_id
+        return True
+
+
 # Configure logging
+session_log_filter = SessionLogFilter()
+log_handler = logging.StreamHandler()
+log_handler.addFilter(session_log_filter)
 logging.basicConfig(
     level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()],
+    format="%(asctime)s - %(name)s - %(levelname)s - [%(session_id)s] %(message)s",
+    handlers=[log_handler],
 )
 logger = logging.getLogger("todord")
 
 
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Move log output to a background thread so writes don't block the event loop.
+
+    The root logger's handlers are replaced by a QueueHandler, and the returned
+    listener writes the queued records through the original handlers. Messages
+    are still formatted by the QueueHandler in the thread that logs them.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Stamp the session ID in the thread that logs, before the record is
+    # queued, and only there rather than again on the listener thread
+    queue_handler.addFilter(session_log_filter)
+    for handler in handlers:
+        handler.removeFilter(session_log_filter)
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
 # Constants
 class TaskEvent:
     """Constants for task events."""
@@ -44,6 +101,65 @@ class TaskEvent:
     TITLE_EDITED = "task_title_edited"
 
 
+class TaskStatus:
+    """Constants for task statuses."""
+
+    PENDING = "pending"
+    DONE = "done"
+    CLOSED = "closed"
+
+
+# Readable templates for task events, filled with the event details
+READABLE_TASK_EVENTS = {
+    TaskEvent.CREATED: "Created task",
+    TaskEvent.STATUS_UPDATED: "Updated status {}",
+    TaskEvent.LOG_ADDED: "Added log {}",
+    TaskEvent.TITLE_EDITED: "Edited title {}",
+}
+
+
+# Exceptions considered connection failures by the connection monitor
+CONNECTION_ERROR_TYPES: Tuple[type, ...] = (
+    TimeoutError,
+    discord_errors.ConnectionClosed,
+    discord_errors.GatewayNotFound,
+    asyncio.exceptions.CancelledError,
+    discord_errors.HTTPException,
+    discord_errors.LoginFailure,
+    client_exceptions.ClientConnectorError,
+    client_exceptions.ClientConnectorDNSError,
+)
+
+# Errors from starting the bot that are worth retrying; anything else,
+# including a rejected token (LoginFailure), is reported and exits
+TRANSIENT_START_ERRORS: Tuple[type, ...] = (
+    TimeoutError,
+    discord_errors.ConnectionClosed,
+    discord_errors.GatewayNotFound,
+    client_exceptions.ClientConnectorError,
+)
+
+
+def _is_transient_start_error(exc: BaseException) -> bool:
+    """Check whether a failed start may succeed if it is tried again."""
+    if isinstance(exc, discord_errors.HTTPException):
+        # Rate limits and server errors pass; other 4xx responses won't
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, TRANSIENT_START_ERRORS)
+
+
+# Connection failure types that should cause an immediate exit
+CRITICAL_CONNECTION_ERRORS = frozenset(
+    {
+        "ConnectionClosed",
+        "GatewayNotFound",
+        "LoginFailure",
+        "Disconnection",
+        "ClientConnectorDNSError",
+    }
+)
+
+
 # Exceptions
 class TodordError(Exception):
     """Base exception for Todord errors."""
@@ -52,46 +168,123 @@ class TodordError(Exception):
 
 
 # Utility Functions
-def create_embed(ctx, title, description, color):
-    """Create a standardized Discord embed."""
+def create_embed(ctx, title, description, color, requester=None):
+    """Create a standardized Discord embed.
+
+    requester names the user in the footer when there is no command context.
+    """
+    if requester is None:
+        requester = ctx.author.name
     embed = discord.Embed(title=title, description=description, color=color)
-    embed.set_footer(text=f"Requested by {ctx.author.name}")
+    embed.set_footer(text=f"Requested by {requester}")
     return embed
 
 
+# (epoch second, formatted local time) of the last internal log timestamp
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def _now_str() -> str:
+    """Return the local time as YYYY-MM-DD HH:MM:SS, formatted once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache = (
+            now,
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+        )
+    return _timestamp_cache[1]
+
+
+def _truncate(text: str, length: int = 30) -> str:
+    """Shorten text to length characters, marking cut text with '...'."""
+    return text if len(text) <= length else f"{text[:length]}..."
+
+
+# Separator line under each category in the !help embed
+HELP_SEPARATOR = "-" * 75
+
+# Rendered !help embeds keyed on the commands visible to the caller, as
+# (time built, embed). Module level since discord.py copies the help command
+# for every invocation; lives for the process, with expired entries pruned.
+HELP_CACHE_TTL = 60.0
+_help_cache: Dict[tuple, Tuple[float, discord.Embed]] = {}
+
+
+# Save files are named APP_NAME_<session_id>_<YYYY-MM-DD_HH-MM-SS>Z.json
+SAVEFILE_PREFIX = f"{APP_NAME}_"
+SAVEFILE_SUFFIX = "Z.json"
+SAVEFILE_TIMESTAMP = "0000-00-00_00-00-00"  # 0 marks a digit position
+
+
+def _is_valid_savefile(name: str) -> bool:
+    """Check a save file name with plain string operations instead of a regex."""
+    # Prefix, at least one session character, "_", timestamp and suffix
+    min_length = (
+        len(SAVEFILE_PREFIX) + 2 + len(SAVEFILE_TIMESTAMP) + len(SAVEFILE_SUFFIX)
+    )
+    if (
+        len(name) < min_length
+        or not name.startswith(SAVEFILE_PREFIX)
+        or not name.endswith(SAVEFILE_SUFFIX)
+        or "\n" in name
+    ):
+        return False
+
+    start = len(name) - len(SAVEFILE_SUFFIX) - len(SAVEFILE_TIMESTAMP)
+    if name[start - 1] != "_":
+        return False
+    for char, expected in zip(name[start:], SAVEFILE_TIMESTAMP):
+        if expected == "0":
+            if char not in "0123456789":
+                return False
+        elif char != expected:
+            return False
+    return True
+
+
+@dataclass(eq=False, slots=True)
 class Task:
     """Represents a task in a to-do list."""
 
-    def __init__(
-        self,
-        ctx: commands.Context,
-        id: int,
-        title: str,
-        status: str,
-        logs: Optional[List[str]] = None,
-        creator: Optional[str] = None,
-    ) -> None:
-        self.id: int = id
-        self.title: str = title
-        self.status: str = status
-        self.logs: List[str] = logs or []
-        self.internal_logs: List[Tuple[str, str, str]] = []  # (timestamp, user, log)
-        self.creator: str = creator or ctx.author.name
+    ctx: InitVar[commands.Context]
+    id: int
+    title: str
+    status: str
+    logs: Optional[List[str]] = None
+    internal_logs: List[Tuple[str, str, str, str]] = field(
+        default_factory=list, init=False
+    )  # (timestamp, user, event, details)
+    creator: Optional[str] = None
+
+    def __post_init__(self, ctx: commands.Context) -> None:
+        self.logs = self.logs or []
+        self.creator = self.creator or ctx.author.name
         self.add_internal_log(ctx, TaskEvent.CREATED)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Task":
+        """Rebuild a saved task without recording a new creation event."""
+        task = object.__new__(cls)
+        task.id = data["id"]
+        task.title = data["title"]
+        # Statuses repeat across every task, so share one string object each
+        task.status = sys.intern(data["status"])
+        task.logs = data.get("logs") or []
+        task.internal_logs = [
+            _upgrade_internal_log(entry) for entry in data.get("internal_logs", [])
+        ]
+        task.creator = data.get("creator") or "Unknown"
+        return task
+
     def add_internal_log(
         self, ctx: commands.Context, log: str, extra_info: str = ""
     ) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        user = ctx.author.name
-        action = log if not extra_info else f"{log}: {extra_info}"
-        self.internal_logs.append((timestamp, user, action))
+        self.internal_logs.append((_now_str(), ctx.author.name, log, extra_info))
 
     def add_log(self, ctx: commands.Context, log: str) -> None:
         self.logs.append(log)
-        self.add_internal_log(
-            ctx, TaskEvent.LOG_ADDED, f"'{log[:30]}{'...' if len(log) > 30 else ''}'"
-        )
+        self.add_internal_log(ctx, TaskEvent.LOG_ADDED, f"'{_truncate(log)}'")
 
     def set_status(self, ctx: commands.Context, status: str) -> None:
         old_status = self.status
@@ -106,41 +299,47 @@ class Task:
         self.add_internal_log(
             ctx,
             TaskEvent.TITLE_EDITED,
-            f"from '{old_title[:30]}{'...' if len(old_title) > 30 else ''}' to '{title[:30]}{'...' if len(title) > 30 else ''}'",
+            f"from '{_truncate(old_title)}' to '{_truncate(title)}'",
         )
 
-    def show_details(self) -> str:
-        details = [f"**[{self.status}] {self.title}**"]
-        details.append(f"Created by: {self.creator}")
+    def _detail_lines(self) -> Iterator[Tuple[str, bool]]:
+        """Yield (line, is_entry) pairs for show_details, entries being logs or history."""
+        yield f"**[{self.status}] {self.title}**", False
+        yield f"Created by: {self.creator}", False
 
         # Add task logs if any
         if self.logs:
-            details.append("\n**Logs:**")
+            yield "\n**Logs:**", False
             for i, log in enumerate(self.logs, 1):
-                details.append(f"{i}. {log}")
+                yield f"{i}. {log}", True
 
         # Add history from internal logs
         if self.internal_logs:
-            details.append("\n**History:**")
-            for timestamp, user, action in self.internal_logs:
-                # Extract the basic action type
-                action_type = action.split(":", 1)[0] if ":" in action else action
-                action_details = (
-                    action.split(":", 1)[1].strip() if ":" in action else ""
-                )
-
+            yield "\n**History:**", False
+            for timestamp, user, action_type, action_details in self.internal_logs:
                 # Convert action code to readable text
-                readable_action = action_type
-                if action_type == TaskEvent.CREATED:
-                    readable_action = "Created task"
-                elif action_type == TaskEvent.STATUS_UPDATED:
-                    readable_action = f"Updated status {action_details}"
-                elif action_type == TaskEvent.LOG_ADDED:
-                    readable_action = f"Added log {action_details}"
-                elif action_type == TaskEvent.TITLE_EDITED:
-                    readable_action = f"Edited title {action_details}"
-
-                details.append(f"• {timestamp} - {user}: {readable_action}")
+                template = READABLE_TASK_EVENTS.get(action_type)
+                if template is None:
+                    readable_action = action_type
+                else:
+                    readable_action = template.format(action_details)
+
+                yield f"• {timestamp} - {user}: {readable_action}", True
+
+    def show_details(self, max_length: int = 3900) -> str:
+        # Lines are rendered lazily and stop once max_length is reached,
+        # keeping the result within Discord's 4096 character embed limit
+        details = []
+        length = 0
+        shown_entries = 0
+        for line, is_entry in self._detail_lines():
+            length += len(line) + 1
+            if length > max_length:
+                remaining = len(self.logs) + len(self.internal_logs) - shown_entries
+                details.append(f"... ({remaining} more entries truncated)")
+                break
+            details.append(line)
+            shown_entries += is_entry
 
         return "\n".join(details)
 
@@ -148,86 +347,294 @@ class Task:
         return f"**[{self.status}] {self.title}**"
 
 
+def _upgrade_internal_log(entry: List[str]) -> Tuple[str, str, str, str]:
+    """Convert a saved internal log entry to (timestamp, user, event, details).
+
+    Older save files stored the event and details as one "event: details" string.
+    """
+    if len(entry) == 3:
+        timestamp, user, action = entry
+        event, _, details = action.partition(":")
+        return (timestamp, user, sys.intern(event), details.strip())
+    timestamp, user, event, details = entry
+    return (timestamp, user, sys.intern(event), details)
+
+
+def _json_default(obj):
+    """Encode tasks for the ujson and json fallbacks, which lack dataclass support."""
+    if isinstance(obj, Task):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj) -> bytes:
+    """Encode obj as JSON indented by two spaces, using the fastest available library.
+
+    The output is byte-identical whichever of orjson, ujson or json is used.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if json_fallback.__name__ == "ujson":
+        # ujson escapes "/" by default, unlike orjson and json
+        return json_fallback.dumps(
+            obj,
+            indent=2,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            default=_json_default,
+        ).encode()
+    return json_fallback.dumps(
+        obj, indent=2, ensure_ascii=False, default=_json_default
+    ).encode()
+
+
+def loads_json(data: bytes):
+    """Decode JSON bytes, using the fastest available library."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json_fallback.loads(data)
+
+
 class StorageManager:
     """Manages task persistence."""
 
-    def __init__(self, data_dir: Union[str, Path], session_id: str) -> None:
+    def __init__(
+        self, data_dir: Union[str, Path], session_id: str, save_delay: float = 1.0
+    ) -> None:
         self.data_dir = Path(data_dir)
         self.session_id = session_id
         self.todo_lists: Dict[int, List[Task]] = {}  # channel_id -> [Task, Task, ...]
-        # Regex to validate save file names: APP_NAME_SESSIONID_YYYY-MM-DD_HH-MM-SS.json
-        self.filename_pattern = re.compile(
-            rf"^{re.escape(APP_NAME)}_.+_[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}_[0-9]{{2}}-[0-9]{{2}}-[0-9]{{2}}Z\.json$"
-        )
+        # Changes are saved by a background writer, coalescing bursts of
+        # commands into a single save every save_delay seconds
+        self.save_delay = save_delay
+        self._dirty: Set[int] = set()  # channel_ids changed since the last save
+        self._save_event = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._next_task_ids: Dict[int, int] = {}  # channel_id -> next task ID
+        # channel_id -> encoded task list, reused by save() until mark_dirty is
+        # called for the channel. Any code that changes a channel's tasks must
+        # call mark_dirty, or later saves keep writing the old list.
+        self._encoded_channels: Dict[int, bytes] = {}
+        # (content digest, filename) of the last file written by save()
+        self._last_save: Optional[Tuple[bytes, str]] = None
+        # (data_dir mtime, sorted save files) from the last directory scan
+        self._files_cache: Optional[Tuple[int, List[str]]] = None
 
         if not self.data_dir.exists():
             self.data_dir.mkdir(parents=True)
-            logger.info(f"Created data directory: {self.data_dir}")
+            logger.info("Created data directory: %s", self.data_dir)
+
+    @staticmethod
+    def is_valid_filename(filename: str) -> bool:
+        """Check that filename names a save file directly inside the data directory."""
+        if "/" in filename or "\\" in filename or "\x00" in filename:
+            return False
+        if ".." in filename:
+            return False
+        return _is_valid_savefile(filename)
+
+    def next_task_id(self, channel_id: int) -> int:
+        """Return a new task ID for a channel, not reused after tasks are removed."""
+        task_id = self._next_task_ids.get(channel_id)
+        if task_id is None:
+            # First use since start or load: continue after the highest ID
+            tasks = self.todo_lists.get(channel_id, [])
+            task_id = max((task.id for task in tasks), default=-1) + 1
+        self._next_task_ids[channel_id] = task_id + 1
+        return task_id
+
+    def mark_dirty(self, channel_id: int) -> None:
+        """Schedule a save after a change to a channel's to-do list.
+
+        Must be called after every change, right after the change is made, as
+        it is also what invalidates the channel's cached encoding.
+        """
+        self._dirty.add(channel_id)
+        self._save_event.set()
+
+    def start_writer(self) -> None:
+        """Start the background task that saves pending changes."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def close(self) -> None:
+        """Stop the background writer and save any pending changes."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
+        if self._dirty:
+            await self.save()
+
+    async def _writer_loop(self) -> None:
+        while True:
+            await self._save_event.wait()
+            # Let a burst of changes settle so it is written only once
+            await asyncio.sleep(self.save_delay)
+            self._save_event.clear()
+
+            if not self._dirty:
+                continue
+            try:
+                filename = await self.save()
+                logger.debug("Saved pending changes to %s", filename)
+            except Exception as e:
+                logger.error("Error saving todo lists: %s", e, exc_info=True)
 
     async def save(self, ctx: Optional[commands.Context] = None) -> str:
         current_time = datetime.now(timezone.utc)
         filename = f"{APP_NAME}_{self.session_id}_{current_time.strftime('%Y-%m-%d_%H-%M-%SZ')}.json"
         filepath = self.data_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(self.todo_lists, f, default=lambda o: o.__dict__, indent=2)
+        # Everything pending is covered by this save
+        dirty, self._dirty = self._dirty, set()
+
+        try:
+            for channel_id in dirty:
+                self._encoded_channels.pop(channel_id, None)
+            payload = self._encode_todo_lists()
+
+            # Nothing changed since the last save; don't write a duplicate file
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if (
+                self._last_save is not None
+                and self._last_save[0] == digest
+                and (self.data_dir / self._last_save[1]).exists()
+            ):
+                return self._last_save[1]
+
+            # Write from a worker thread so a slow disk doesn't block the event loop
+            await asyncio.to_thread(self._save_sync, payload, filepath)
+            self._files_cache = None
+            self._last_save = (digest, filename)
+        except BaseException:
+            # Keep the changes pending so the next save retries them
+            self._dirty |= dirty
+            raise
 
         return filename
 
-    async def load(self, ctx: commands.Context, filename: str) -> bool:
-        # Validate filename format
-        if not self.filename_pattern.match(filename):
+    def _encode_todo_lists(self) -> bytes:
+        """Encode todo_lists, re-encoding only channels changed since the last save.
+
+        The output is identical to a full dumps_json of todo_lists, so save
+        files keep a single, unchanged format.
+        """
+        if not self.todo_lists:
+            return b"{}"
+
+        # Forget channels that no longer exist (e.g. after a load)
+        for channel_id in self._encoded_channels.keys() - self.todo_lists.keys():
+            del self._encoded_channels[channel_id]
+
+        entries = []
+        for channel_id, tasks in self.todo_lists.items():
+            encoded = self._encoded_channels.get(channel_id)
+            if encoded is None:
+                # Nest the list one level deeper to sit inside the outer object
+                encoded = dumps_json(tasks).replace(b"\n", b"\n  ")
+                self._encoded_channels[channel_id] = encoded
+            entries.append(b'  "%s": %s' % (str(channel_id).encode(), encoded))
+
+        return b"{\n" + b",\n".join(entries) + b"\n}"
+
+    @staticmethod
+    def _save_sync(payload: bytes, filepath: Path) -> None:
+        # Write to a hidden temporary file and rename it into place, so a
+        # crash mid-write never leaves a truncated save file behind
+        tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                # Make sure the data is on disk before the rename makes it visible
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    async def load(self, filename: str) -> bool:
+        # Validate filename format; cheap, so kept for callers other than !load
+        if not self.is_valid_filename(filename):
             logger.error(
-                f"Attempted to load file with invalid format: {filename}. "
-                f"Expected format: {APP_NAME}_<session_id>_<YYYY-MM-DD_HH-MM-SS>Z.json"
+                "Attempted to load file with invalid format: %s. "
+                "Expected format: %s_<session_id>_<YYYY-MM-DD_HH-MM-SS>Z.json",
+                filename,
+                APP_NAME,
             )
             return False
 
+        # Write out changes the background writer hasn't saved yet, so
+        # replacing the state doesn't silently discard them
+        if self._dirty:
+            try:
+                await self.save()
+            except OSError as e:
+                logger.error(
+                    "Not loading %s, pending changes could not be saved: %s",
+                    filename,
+                    e,
+                )
+                return False
+
         try:
             filepath = self.data_dir / filename
-            with open(filepath, "r") as f:
-                data = json.load(f)
-
-            reconstructed_todo_lists: Dict[int, List[Task]] = {}
-
-            for channel_id, tasks in data.items():
-                channel_id_int = int(
-                    channel_id
-                )  # JSON keys are strings, convert back to int
-                reconstructed_todo_lists[channel_id_int] = []
-
-                for task_data in tasks:
-                    task = Task(
-                        ctx,
-                        task_data["id"],
-                        task_data["title"],
-                        task_data["status"],
-                        task_data.get("logs", []),
-                        task_data.get("creator", "Unknown"),
-                    )
+            data = await asyncio.to_thread(self._load_sync, filepath)
 
-                    if "internal_logs" in task_data:
-                        task.internal_logs = task_data["internal_logs"]
-
-                    reconstructed_todo_lists[channel_id_int].append(task)
+            # JSON keys are strings, convert back to int
+            reconstructed_todo_lists: Dict[int, List[Task]] = {
+                int(channel_id): [Task.from_dict(task_data) for task_data in tasks]
+                for channel_id, tasks in data.items()
+            }
 
             self.todo_lists = reconstructed_todo_lists
+            # The loaded state is already on disk, nothing is left to save
+            self._dirty.clear()
+            self._encoded_channels.clear()
+            self._next_task_ids.clear()
+            self._last_save = None
             return True
 
-        except Exception as e:
-            logger.error(f"Error loading todo lists: {e}")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # Unreadable file, invalid JSON or unexpected structure
+            logger.error("Error loading todo lists from %s: %s", filename, e)
             return False
 
+    @staticmethod
+    def _load_sync(filepath: Path) -> dict:
+        # Decode in the worker thread as well, as it is the bulk of the work
+        return loads_json(filepath.read_bytes())
+
     def list_saved_files(self) -> List[str]:
+        # The directory mtime changes whenever a file is added or removed,
+        # so an unchanged mtime means the previous scan is still valid
+        mtime = self.data_dir.stat().st_mtime_ns
+        if self._files_cache is not None and self._files_cache[0] == mtime:
+            return list(self._files_cache[1])
+
         valid_files = []
-        for f in os.listdir(self.data_dir):
-            if self.filename_pattern.match(f):
-                valid_files.append(f)
+        # scandir entries carry the file type, so no extra stat per file
+        with os.scandir(self.data_dir) as it:
+            for entry in it:
+                if _is_valid_savefile(entry.name) and entry.is_file():
+                    valid_files.append(entry.name)
 
         # Sort files based on the timestamp in the filename (YYYY-MM-DD_HH-MM-SS)
         # which is the 19 characters before ".json"
         valid_files.sort(key=lambda x: x[-24:-5])
-        return valid_files
+        self._files_cache = (mtime, valid_files)
+        return list(valid_files)
+
+    def latest_saved_file(self) -> Optional[str]:
+        # The timestamp in the filename is used rather than the file mtime,
+        # since git syncs (syng) rewrite mtimes of pulled files.
+        files = self.list_saved_files()
+        return files[-1] if files else None
 
 
 class CustomHelpCommand(commands.HelpCommand):
@@ -244,54 +651,80 @@ class CustomHelpCommand(commands.HelpCommand):
         )
 
     async def send_bot_help(self, mapping):
+        # Filter commands that can be run; this decides what the user sees,
+        # so it runs on every call and keys the cached embed
+        visible = []
+        for cog, cmds in mapping.items():
+            filtered = await self.filter_commands(cmds, sort=True)
+            if filtered:
+                visible.append((cog, filtered))
+
+        key = tuple(
+            (
+                getattr(cog, "qualified_name", None),
+                tuple(command.qualified_name for command in filtered),
+            )
+            for cog, filtered in visible
+        )
+        now = time.monotonic()
+        cached = _help_cache.get(key)
+        if cached is not None and now - cached[0] < HELP_CACHE_TTL:
+            await self.get_destination().send(embed=cached[1])
+            return
+
         embed = discord.Embed(
             title="!help command:",
             color=discord.Color.blue(),
         )
 
-        for cog, cmds in mapping.items():
-            # Filter commands that can be run
-            filtered = await self.filter_commands(cmds, sort=True)
-            if filtered:
-                name = getattr(cog, "qualified_name", "Other Commands")
-
-                cog_description = ""
-                if cog and cog.description:
-                    cog_description = f"{cog.description}\n"
-
-                # Create command list for this category
-                command_list = []
-                for command in filtered:
-                    name_with_aliases = f"`!{command.name}`"
-                    if command.aliases:
-                        aliases = ", ".join(f"`!{alias}`" for alias in command.aliases)
-                        name_with_aliases = f"{name_with_aliases}\t{aliases}"
-
-                    usage = f"`!{command.name}"
-                    if command.signature:
-                        usage += f" {command.signature}"
-                    usage += "`"
-
-                    # Add usage above command description
-                    command_list.append(
-                        f"**{name_with_aliases}**\u00a0\u00a0\u00a0{command.short_doc}\n> Usage: {usage}\n"
-                    )
+        for cog, filtered in visible:
+            name = getattr(cog, "qualified_name", "Other Commands")
 
-                if command_list:
-                    # add an embed field to give space for the cog title and desc
-                    embed.add_field(
-                        name="\n",
-                        value="\n",
-                        inline=False,
-                    )
-                    embed.add_field(
-                        name=f"📋 **{name}** - {cog_description}",
-                        value=f"{'---' * 25}\n" + "\n".join(command_list),
-                        inline=False,
+            cog_description = ""
+            if cog and cog.description:
+                cog_description = f"{cog.description}\n"
+
+            # Create command list for this category
+            command_list = []
+            for command in filtered:
+                name_parts = [f"`!{command.name}`"]
+                if command.aliases:
+                    name_parts.append(
+                        ", ".join(f"`!{alias}`" for alias in command.aliases)
                     )
+                name_with_aliases = "\t".join(name_parts)
+
+                if command.signature:
+                    usage = f"`!{command.name} {command.signature}`"
+                else:
+                    usage = f"`!{command.name}`"
+
+                # Add usage above command description
+                command_list.append(
+                    f"**{name_with_aliases}**\u00a0\u00a0\u00a0{command.short_doc}\n> Usage: {usage}\n"
+                )
+
+            # add an embed field to give space for the cog title and desc
+            embed.add_field(
+                name="\n",
+                value="\n",
+                inline=False,
+            )
+            embed.add_field(
+                name=f"📋 **{name}** - {cog_description}",
+                value=f"{HELP_SEPARATOR}\n" + "\n".join(command_list),
+                inline=False,
+            )
 
         embed.set_footer(text="Type !help <command> for detailed info on a command.")
 
+        # Drop expired entries so the cache only holds live command sets
+        for stale_key in [
+            k for k, (t, _) in _help_cache.items() if now - t >= HELP_CACHE_TTL
+        ]:
+            del _help_cache[stale_key]
+        _help_cache[key] = (now, embed)
+
         await self.get_destination().send(embed=embed)
 
     async def send_command_help(self, command):
@@ -365,15 +798,15 @@ class TodoList(commands.Cog):
         if channel_id not in self.storage.todo_lists:
             self.storage.todo_lists[channel_id] = []
 
-        task_id = len(self.storage.todo_lists[channel_id])
-        new_task = Task(ctx, task_id, task, "pending", [])
+        task_id = self.storage.next_task_id(channel_id)
+        new_task = Task(ctx, task_id, task, TaskStatus.PENDING, [])
         self.storage.todo_lists[channel_id].append(new_task)
+        self.storage.mark_dirty(channel_id)
 
         embed = create_embed(
             ctx, "✅ Task Added", f"**{new_task.title}**", discord.Color.green()
         )
         await ctx.reply(embed=embed)
-        await self.storage.save(ctx)
 
     @commands.command(
         name="list",
@@ -394,9 +827,9 @@ class TodoList(commands.Cog):
             await ctx.reply(embed=embed)
             return
 
-        response = ""
-        for idx, task in enumerate(tasks, start=1):
-            response += f"{idx}. {task}\n"
+        response = "\n".join(
+            f"{idx}. {task}" for idx, task in enumerate(tasks, start=1)
+        )
 
         embed = create_embed(
             ctx, "📋 Channel To-Do List", response, discord.Color.blue()
@@ -424,13 +857,13 @@ class TodoList(commands.Cog):
 
         if 0 < task_number <= len(tasks):
             removed = tasks.pop(task_number - 1)
-            removed.set_status(ctx, "done")
+            removed.set_status(ctx, TaskStatus.DONE)
+            self.storage.mark_dirty(channel_id)
 
             embed = create_embed(
                 ctx, "✔️ Task Marked as Done", f"**{removed}**", discord.Color.green()
             )
             await ctx.reply(embed=embed)
-            await self.storage.save(ctx)
         else:
             embed = create_embed(
                 ctx,
@@ -461,7 +894,8 @@ class TodoList(commands.Cog):
 
         if 0 < task_number <= len(tasks):
             removed = tasks.pop(task_number - 1)
-            removed.set_status(ctx, "closed")
+            removed.set_status(ctx, TaskStatus.CLOSED)
+            self.storage.mark_dirty(channel_id)
 
             embed = create_embed(
                 ctx,
@@ -470,7 +904,6 @@ class TodoList(commands.Cog):
                 discord.Color.orange(),
             )
             await ctx.reply(embed=embed)
-            await self.storage.save(ctx)
         else:
             embed = create_embed(
                 ctx,
@@ -504,15 +937,17 @@ class TodoList(commands.Cog):
         if 0 < task_number <= len(tasks):
             task = tasks[task_number - 1]
             task.add_log(ctx, log)
+            self.storage.mark_dirty(channel_id)
 
+            # Shorten the echoed log so the details always have room to fit
+            header = f"Log: '{_truncate(log, 1000)}'\n\n**Current Task Details:**\n"
             embed = create_embed(
                 ctx,
                 f"📝 Log Added to Task #{task_number}",
-                f"Log: '{log}'\n\n**Current Task Details:**\n{task.show_details()}",
+                header + task.show_details(max_length=max(0, 3900 - len(header))),
                 discord.Color.green(),
             )
             await ctx.reply(embed=embed)
-            await self.storage.save(ctx)
         else:
             embed = create_embed(
                 ctx,
@@ -583,6 +1018,7 @@ class TodoList(commands.Cog):
             task = tasks[task_number - 1]
             old_title = task.title
             task.set_title(ctx, new_title)
+            self.storage.mark_dirty(channel_id)
 
             embed = create_embed(
                 ctx,
@@ -591,7 +1027,6 @@ class TodoList(commands.Cog):
                 discord.Color.green(),
             )
             await ctx.reply(embed=embed)
-            await self.storage.save(ctx)
         else:
             embed = create_embed(
                 ctx,
@@ -622,6 +1057,7 @@ class BotManagement(commands.Cog):
             and self.storage.todo_lists[channel_id]
         ):
             self.storage.todo_lists[channel_id] = []
+            self.storage.mark_dirty(channel_id)
             embed = create_embed(
                 ctx,
                 "🗑️ List Cleared",
@@ -629,7 +1065,6 @@ class BotManagement(commands.Cog):
                 discord.Color.orange(),  # Using orange for potentially destructive actions
             )
             await ctx.reply(embed=embed)
-            await self.storage.save(ctx)
         else:
             embed = create_embed(
                 ctx,
@@ -670,22 +1105,11 @@ class BotManagement(commands.Cog):
         help="Load state from a previously saved file.",
     )
     async def load_command(self, ctx: commands.Context, filename: str) -> None:
-        # Basic validation to prevent path traversal
-        if ".." in filename or "/" in filename:
+        # Validate the format, which also rejects path traversal
+        if not self.storage.is_valid_filename(filename):
             embed = create_embed(
                 ctx,
                 "❌ Invalid Filename",
-                "Invalid characters detected in filename.",
-                discord.Color.red(),
-            )
-            await ctx.reply(embed=embed)
-            return
-
-        # Validate filename format using the regex from StorageManager
-        if not self.storage.filename_pattern.match(filename):
-            embed = create_embed(
-                ctx,
-                "❌ Invalid Filename Format",
                 f"Filename '{filename}' does not match the expected format: "
                 f"`{APP_NAME}_<session_id>_<YYYY-MM-DD_HH-MM-SS>Z.json`",
                 discord.Color.red(),
@@ -693,7 +1117,7 @@ class BotManagement(commands.Cog):
             await ctx.reply(embed=embed)
             return
 
-        success = await self.storage.load(ctx, filename)
+        success = await self.storage.load(filename)
         if success:
             embed = create_embed(
                 ctx,
@@ -717,38 +1141,50 @@ class BotManagement(commands.Cog):
         help="Load the most recently state saved in file.",
     )
     async def loadlast_command(self, ctx: commands.Context) -> None:
-        files = self.storage.list_saved_files()
+        await self.load_last_state(ctx.send, ctx.author.name)
 
-        if not files:
+    async def load_last_state(self, send, requester: str) -> Optional[str]:
+        """Load the most recent save file, reporting the result through send.
+
+        Shared by !loadlast and the startup auto-load, which has no command
+        context. Returns the loaded filename, or None if nothing was loaded.
+        """
+
+        # Scanning the data directory is blocking I/O, keep it off the event loop
+        most_recent_file = await asyncio.to_thread(self.storage.latest_saved_file)
+
+        if not most_recent_file:
             embed = create_embed(
-                ctx,
+                None,
                 "ℹ️ No Files Found",
                 "No saved to-do list files found.",
                 discord.Color.blue(),
+                requester=requester,
             )
-            await ctx.send(embed=embed)
-            return
+            await send(embed=embed)
+            return None
 
-        # Files are already sorted by creation time, so the last one is the most recent
-        most_recent_file = files[-1]
-
-        success = await self.storage.load(ctx, most_recent_file)
+        success = await self.storage.load(most_recent_file)
         if success:
             embed = create_embed(
-                ctx,
+                None,
                 "📂 Last List Loaded",
                 f"Successfully loaded the most recent lists from `{most_recent_file}`.",
                 discord.Color.green(),
+                requester=requester,
             )
-            await ctx.send(embed=embed)
-        else:
-            embed = create_embed(
-                ctx,
-                "❌ Error Loading",
-                f"Failed to load the most recent lists from `{most_recent_file}`. The file might be corrupted.",
-                discord.Color.red(),
-            )
-            await ctx.send(embed=embed)
+            await send(embed=embed)
+            return most_recent_file
+
+        embed = create_embed(
+            None,
+            "❌ Error Loading",
+            f"Failed to load the most recent lists from `{most_recent_file}`. The file might be corrupted.",
+            discord.Color.red(),
+            requester=requester,
+        )
+        await send(embed=embed)
+        return None
 
     @commands.command(
         name="list_files",
@@ -757,7 +1193,7 @@ class BotManagement(commands.Cog):
     )
     async def list_files_command(self, ctx: commands.Context) -> None:
         try:
-            files = self.storage.list_saved_files()
+            files = await asyncio.to_thread(self.storage.list_saved_files)
             if files:
                 # Format files nicely, potentially with numbering
                 files_list = "\n".join([f"{i + 1}. `{f}`" for i, f in enumerate(files)])
@@ -791,9 +1227,15 @@ class ConnectionMonitor:
         self.max_retries = max_retries
         self.consecutive_failures = 0
         self.total_failures = 0
-        self.failure_types = {}
+        self.failure_types: Counter[str] = Counter()
         self.last_failure_time = None
         self.first_failure_time = None
+        # Monotonic clock readings used for elapsed time, immune to clock jumps
+        self.first_failure_mono: Optional[float] = None
+        self.last_failure_mono: Optional[float] = None
+        # Sorted view of failure_types, rebuilt only after a new failure
+        self._sorted_failure_types: List[Tuple[str, int]] = []
+        self._sorted_dirty = True
 
     def connection_successful(self) -> None:
         if self.consecutive_failures > 0:
@@ -804,40 +1246,31 @@ class ConnectionMonitor:
 
     def connection_failed(self, error_type: str) -> bool:
         now = datetime.now()
+        now_mono = time.monotonic()
         if self.consecutive_failures == 0:
             self.first_failure_time = now
+            self.first_failure_mono = now_mono
 
         self.consecutive_failures += 1
         self.total_failures += 1
         self.last_failure_time = now
+        self.last_failure_mono = now_mono
 
         # Track types of failures
-        if error_type in self.failure_types:
-            self.failure_types[error_type] += 1
-        else:
-            self.failure_types[error_type] = 1
+        self.failure_types[error_type] += 1
+        self._sorted_dirty = True
 
         # Log detailed failure info
-        elapsed = None
-        if self.first_failure_time:
-            elapsed_seconds = (now - self.first_failure_time).total_seconds()
-            elapsed = f"{elapsed_seconds:.1f} seconds"
-
         logger.warning(
-            f"Connection failure #{self.consecutive_failures}: {error_type}. "
-            f"Total failures: {self.total_failures}"
-            + (f" in {elapsed}" if elapsed else "")
+            "Connection failure #%d: %s. Total failures: %d in %.1f seconds",
+            self.consecutive_failures,
+            error_type,
+            self.total_failures,
+            now_mono - self.first_failure_mono,
         )
 
         # Critical errors that should cause immediate exit
-        critical_errors = [
-            "ConnectionClosed",
-            "GatewayNotFound",
-            "LoginFailure",
-            "Disconnection",
-            "ClientConnectorDNSError",
-        ]
-        if error_type in critical_errors and self.consecutive_failures >= 2:
+        if error_type in CRITICAL_CONNECTION_ERRORS and self.consecutive_failures >= 2:
             logger.critical(
                 f"Critical connection error: {error_type}. Exiting immediately."
             )
@@ -858,7 +1291,7 @@ class ConnectionMonitor:
             return "No connection failures detected"
 
         status = [
-            f"Connection Status Report:",
+            "Connection Status Report:",
             f"- Total failures: {self.total_failures}",
             f"- Consecutive failures: {self.consecutive_failures}",
         ]
@@ -881,57 +1314,173 @@ class ConnectionMonitor:
 
         status.append("- Failure types:")
 
-        if not self.failure_types:
+        if self._sorted_dirty:
+            self._sorted_failure_types = sorted(
+                self.failure_types.items(), key=itemgetter(1), reverse=True
+            )
+            self._sorted_dirty = False
+
+        if not self._sorted_failure_types:
             status.append("  - None recorded")
         else:
-            for error_type, count in sorted(
-                self.failure_types.items(), key=lambda x: x[1], reverse=True
-            ):
-                percentage = (count / self.total_failures) * 100
-                status.append(f"  - {error_type}: {count} ({percentage:.1f}%)")
+            total = self.total_failures
+            status.extend(
+                [
+                    f"  - {error_type}: {count} ({(count / total) * 100:.1f}%)"
+                    for error_type, count in self._sorted_failure_types
+                ]
+            )
 
         return "\n".join(status)
 
 
 # Bot management functions
+START_RETRY_MAX_DELAY = 30.0  # Upper bound in seconds between bot start attempts
+ANNOUNCEMENT_CONCURRENCY = 8  # Announcement sends in flight at once
+ANNOUNCEMENT_RETRIES = 3  # Attempts per channel when rate limited
+ANNOUNCEMENT_RETRY_DELAY = 1.0  # Base delay in seconds before retrying a send
+
+
+async def _send_announcement(
+    channel, embed: discord.Embed, semaphore: asyncio.Semaphore
+) -> None:
+    """Send an announcement embed, backing off and retrying when rate limited.
+
+    discord.py already waits out and retries 429 responses itself, honouring
+    the server's Retry-After; a 429 only reaches here once it has given up,
+    so this backs off from a fixed base delay instead.
+    """
+    async with semaphore:
+        for attempt in range(ANNOUNCEMENT_RETRIES):
+            try:
+                await channel.send(embed=embed)
+                return
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == ANNOUNCEMENT_RETRIES - 1:
+                    raise
+                await asyncio.sleep(
+                    ANNOUNCEMENT_RETRY_DELAY * 2**attempt * (1 + random.random() * 0.5)
+                )
+
+
 async def send_announcement_to_all_channels(
     bot,
     title: str,
     description: str,
     color: discord.Color,
-    skip_channel_id: Optional[int] = None,
 ) -> None:
     """Send an announcement to all text channels."""
-    for guild in bot.guilds:
-        for channel in guild.text_channels:
-            if skip_channel_id and channel.id == skip_channel_id:
-                continue
-            try:
-                embed = discord.Embed(title=title, description=description, color=color)
-                await channel.send(embed=embed)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to send announcement to {channel.name} in {guild.name}: {e}"
-                )
+    # The embed is identical for every channel, so build it only once
+    embed = discord.Embed(title=title, description=description, color=color)
+    channels = [channel for guild in bot.guilds for channel in guild.text_channels]
+
+    # Send to all channels concurrently instead of one round trip at a time,
+    # capping requests in flight to stay clear of Discord's rate limits
+    semaphore = asyncio.Semaphore(ANNOUNCEMENT_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_send_announcement(channel, embed, semaphore) for channel in channels),
+        return_exceptions=True,
+    )
+    for channel, result in zip(channels, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                f"Failed to send announcement to {channel.name} in {channel.guild.name}: {result}"
+            )
 
 
-async def find_first_available_channel(bot):
+def find_first_available_channel(bot):
     """Find the first available text channel for sending messages."""
     for guild in bot.guilds:
         for channel in guild.text_channels:
-            try:
-                # Try sending a test message
-                test_msg = await channel.send("Testing channel availability...")
-                await test_msg.delete()  # Clean up test message
+            # Check cached permissions instead of probing with a test message
+            permissions = channel.permissions_for(guild.me)
+            if permissions.send_messages and permissions.embed_links:
                 return channel
-            except Exception:
-                continue
     return None
 
 
+def handle_connection_failure(
+    connection_monitor: ConnectionMonitor,
+    error_type: str,
+    message: str = "Connection failure threshold reached. Exiting...",
+) -> None:
+    """Record a connection failure and exit once the threshold is reached."""
+    if connection_monitor.connection_failed(error_type):
+        logger.critical(message)
+        logger.critical(connection_monitor.get_status_report())
+        sys.exit(1)
+
+
+def handle_connection_error(
+    connection_monitor: ConnectionMonitor, exc: Optional[BaseException]
+) -> None:
+    """Record an exception as a connection failure if it is connection-related."""
+    if isinstance(exc, CONNECTION_ERROR_TYPES):
+        error_type = type(exc).__name__
+        logger.warning("Connection error detected: %s: %s", error_type, exc)
+        handle_connection_failure(connection_monitor, error_type)
+
+
 # Command line argument parsing
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+@dataclass
+class Args:
+    """Command line options."""
+
+    data_dir: str = "./data"
+    token: Optional[str] = None
+    debug: bool = False
+    max_retries: int = 3
+    autoload_timeout: float = 30.0
+    save_delay: float = 1.0
+    version: bool = False
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Args:
+    """Parse command line arguments.
+
+    The plain ``--flag value`` forms are handled directly; anything else
+    (``--help``, ``--flag=value``, unknown or malformed options) is handed
+    to argparse, which is only imported in that case.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    def next_value(it) -> str:
+        value = next(it)
+        if value.startswith("-"):
+            raise ValueError(value)
+        return value
+
+    args = Args()
+    it = iter(argv)
+    try:
+        for arg in it:
+            if arg == "--data_dir":
+                args.data_dir = next_value(it)
+            elif arg == "--token":
+                args.token = next_value(it)
+            elif arg == "--debug":
+                args.debug = True
+            elif arg == "--max_retries":
+                args.max_retries = int(next_value(it))
+            elif arg == "--autoload_timeout":
+                args.autoload_timeout = float(next_value(it))
+            elif arg == "--save_delay":
+                args.save_delay = float(next_value(it))
+            elif arg == "--version":
+                args.version = True
+            else:
+                return _parse_args_full(argv)
+    except (StopIteration, ValueError):
+        return _parse_args_full(argv)
+
+    return args
+
+
+def _parse_args_full(argv: List[str]) -> Args:
+    """Parse command line arguments with argparse."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=f"{APP_NAME} - A Discord To-Do List Bot"
     )
@@ -953,16 +1502,28 @@ def parse_args() -> argparse.Namespace:
         default=3,
         help="Maximum number of consecutive connection failures before exiting (default: 3)",
     )
+    parser.add_argument(
+        "--autoload_timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to wait for the startup auto-load before giving up (default: 30)",
+    )
+    parser.add_argument(
+        "--save_delay",
+        type=float,
+        default=1.0,
+        help="Seconds to collect changes before writing them in a single save (default: 1)",
+    )
     parser.add_argument(
         "--version",
         action="store_true",
         help=f"Show {APP_NAME} version information and exit",
     )
 
-    return parser.parse_args()
+    return Args(**vars(parser.parse_args(argv)))
 
 
-def get_token(args: argparse.Namespace) -> Optional[str]:
+def get_token(args: Args) -> Optional[str]:
     """Get the Discord token from args or environment."""
     # First try from args
     if args.token:
@@ -973,18 +1534,96 @@ def get_token(args: argparse.Namespace) -> Optional[str]:
 
 
 # Setup and start the bot
-async def setup_bot(args, token, session_id, connection_monitor):
-    """Set up the Discord bot with all event handlers and cogs."""
-    # Initialize bot with intents
+def create_bot() -> commands.Bot:
+    """Create the Discord bot client with the intents it needs."""
     intents = discord.Intents.default()
     intents.message_content = True
-    bot = commands.Bot(
+    return commands.Bot(
         command_prefix="!", intents=intents, help_command=CustomHelpCommand()
     )
 
+
+async def setup_bot(args, token, session_id, connection_monitor):
+    """Set up the Discord bot with all event handlers and cogs."""
+    bot = create_bot()
+
     # Initialize storage
     data_dir = Path(args.data_dir)
-    storage = StorageManager(data_dir, session_id)
+    storage = StorageManager(data_dir, session_id, save_delay=args.save_delay)
+    bot_management_cog = BotManagement(bot, storage)
+
+    async def restore_and_announce() -> None:
+        # Wait for the first ready event; the gateway must be connected to
+        # find a channel and announce in it
+        await bot.wait_until_ready()
+        if bot.user is None:
+            return
+
+        # Auto-execute loadlast command if there are saved files
+        description = "Ready to help!"
+        most_recent_file = await asyncio.to_thread(storage.latest_saved_file)
+        if most_recent_file:
+            # Find a channel where we can run the command
+            channel = find_first_available_channel(bot)
+            if channel:
+                try:
+                    # Bound the auto-load so a hung disk or corrupt file
+                    # cannot stall startup indefinitely
+                    try:
+                        loaded_file = await asyncio.wait_for(
+                            bot_management_cog.load_last_state(
+                                channel.send, bot.user.name
+                            ),
+                            timeout=args.autoload_timeout,
+                        )
+                    except TimeoutError:
+                        logger.error(
+                            "Auto-load timed out after %.1f seconds; "
+                            "continuing without restored state",
+                            args.autoload_timeout,
+                        )
+                        embed = discord.Embed(
+                            title="⏱️ Auto-load Timed Out",
+                            description="Continuing without the last saved state.",
+                            color=discord.Color.orange(),
+                        )
+                        await channel.send(embed=embed)
+                    else:
+                        if loaded_file:
+                            description += f"\nLoaded state from `{loaded_file}`"
+                except Exception as e:
+                    logger.error(f"Error during auto-load: {e}", exc_info=True)
+            else:
+                logger.warning("Could not find any channel to auto-load state")
+
+        # Announce bot is online (and any restored state) in all text channels
+        await send_announcement_to_all_channels(
+            bot,
+            f"🟢 {APP_NAME} v{APP_VERSION}: Bot Online",
+            description,
+            discord.Color.green(),
+        )
+
+    startup_task: Optional[asyncio.Task] = None
+
+    async def setup_hook() -> None:
+        nonlocal startup_task
+
+        # Runs before connecting, so commands are registered as soon as the
+        # gateway is ready. login() calls it again when main() retries a start.
+        if bot.get_cog("BotManagement") is None:
+            await bot.add_cog(TodoList(bot, storage))
+            await bot.add_cog(bot_management_cog)
+            logger.info("Cogs loaded successfully")
+        storage.start_writer()
+
+        # Restore state and announce once per run, not from on_ready, which
+        # fires again after every reconnect that can't resume the session.
+        # Reloading then would drop unsaved changes and announce again.
+        if startup_task is None:
+            startup_task = asyncio.create_task(restore_and_announce())
+
+    bot.setup_hook = setup_hook
 
     # Define event handlers
     @bot.event
@@ -995,58 +1634,6 @@ async def setup_bot(args, token, session_id, connection_monitor):
         if bot.user:
             logger.info(f"Logged in as {bot.user.name}")
             logger.info(f"Bot ID: {bot.user.id}")
-            logger.info("Session ID: " + session_id)
-
-            # Add cogs
-            await bot.add_cog(TodoList(bot, storage))
-            await bot.add_cog(BotManagement(bot, storage))
-
-            logger.info("Cogs loaded successfully")
-
-            # Announce bot is online in all text channels
-            await send_announcement_to_all_channels(
-                bot,
-                f"🟢 {APP_NAME} v{APP_VERSION}: Bot Online",
-                "Ready to help!",
-                discord.Color.green(),
-            )
-
-            # Auto-execute loadlast command if there are saved files
-            bot_management_cog = bot.get_cog("BotManagement")
-            if bot_management_cog:
-                files = storage.list_saved_files()
-                if files:
-                    # Find a channel where we can run the command
-                    channel = await find_first_available_channel(bot)
-                    if channel:
-                        try:
-                            # Send loading message and create context for command
-                            loading_msg = await channel.send(
-                                "Auto-loading last saved state..."
-                            )
-                            ctx = await bot.get_context(loading_msg)
-
-                            # Execute loadlast command using getattr to fix attribute access error
-                            loadlast_cmd = getattr(
-                                bot_management_cog, "loadlast_command"
-                            )
-                            await loadlast_cmd(ctx)
-
-                            # Announce successful loading to all channels
-                            most_recent_file = files[-1]
-                            await send_announcement_to_all_channels(
-                                bot,
-                                "📂 State Auto-Loaded",
-                                f"Successfully loaded the most recent todo list from `{most_recent_file}`",
-                                discord.Color.green(),
-                                channel.id,  # Skip the channel we already announced in
-                            )
-                        except Exception as e:
-                            logger.error(f"Error during auto-load: {e}", exc_info=True)
-                    else:
-                        logger.warning("Could not find any channel to auto-load state")
-            else:
-                logger.error("BotManagement cog not found for auto-loading")
         else:
             logger.error("Failed to log in - bot.user is None")
 
@@ -1060,13 +1647,11 @@ async def setup_bot(args, token, session_id, connection_monitor):
         logger.warning("Bot disconnected from Discord")
 
         # Track disconnects as connection failures
-        error_type = "Disconnection"
-        if connection_monitor.connection_failed(error_type):
-            logger.critical(
-                "Connection failure threshold reached after multiple disconnections. Exiting..."
-            )
-            logger.critical(connection_monitor.get_status_report())
-            sys.exit(1)
+        handle_connection_failure(
+            connection_monitor,
+            "Disconnection",
+            "Connection failure threshold reached after multiple disconnections. Exiting...",
+        )
 
     @bot.event
     async def on_connect() -> None:
@@ -1075,40 +1660,27 @@ async def setup_bot(args, token, session_id, connection_monitor):
 
     @bot.event
     async def on_error(event_method: str, *_args, **_kwargs) -> None:
-        logger.error(f"Error in {event_method}: {sys.exc_info()[1]}")
+        exc_value = sys.exc_info()[1]
+        logger.error(f"Error in {event_method}: {exc_value}")
 
         # Check if this is a connection-related error
-        exc_type, exc_value, _ = sys.exc_info()
+        handle_connection_error(connection_monitor, exc_value)
 
-        # Check for client connector errors (network issues)
-        if isinstance(
-            exc_value,
-            (
-                TimeoutError,
-                discord_errors.ConnectionClosed,
-                discord_errors.GatewayNotFound,
-                asyncio.exceptions.CancelledError,
-                discord_errors.HTTPException,
-                discord_errors.LoginFailure,
-                client_exceptions.ClientConnectorError,
-                client_exceptions.ClientConnectorDNSError,
-            ),
-        ):
-            error_type = exc_type.__name__  # type: ignore
-            logger.warning(f"Connection error detected: {error_type}: {exc_value}")
-
-            if connection_monitor.connection_failed(error_type):
-                logger.critical("Connection failure threshold reached. Exiting...")
-                logger.critical(connection_monitor.get_status_report())
-                sys.exit(1)
-
-    # Message logging (optional)
-    @bot.listen("on_message")
-    async def on_message(message: discord.Message) -> None:
-        if message.author != bot.user:  # Don't log the bot's own messages
-            logger.debug(
-                f"Message from {message.author} in {message.channel}: {message.content}"
-            )
+    # Message logging, only registered with --debug so normal runs don't pay
+    # for a listener on every message the bot can see
+    if args.debug:
+
+        @bot.listen("on_message")
+        async def on_message(message: discord.Message) -> None:
+            if message.author == bot.user:  # Don't log the bot's own messages
+                return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Message from %s in %s: %s",
+                    message.author,
+                    message.channel,
+                    message.content,
+                )
 
     return bot, storage
 
@@ -1136,9 +1708,10 @@ async def main() -> None:
         )
         sys.exit(1)
 
-    # Generate session ID
-    session_id = str(uuid.uuid4())
-    logger.info("Starting new session: " + session_id)
+    # Generate session ID, short as it is only used to correlate logs and files
+    session_id = secrets.token_hex(4)
+    session_log_filter.session_id = session_id
+    logger.info("Starting new session")
 
     # Log application details
     logger.info(f"Starting {APP_NAME} v{APP_VERSION}")
@@ -1150,37 +1723,52 @@ async def main() -> None:
     )
 
     # Set up the bot with all its handlers and cogs
-    bot, _storage = await setup_bot(args, token, session_id, connection_monitor)
+    bot, storage = await setup_bot(args, token, session_id, connection_monitor)
 
-    # Run the bot
+    # Run the bot, retrying transient connection errors with backoff
+    # until the connection monitor's failure threshold is reached
     try:
-        logger.info("Starting bot...")
-        await bot.start(token)
-    except Exception as e:
-        logger.exception(f"Error starting bot: {e}")
+        attempt = 0
+        while True:
+            try:
+                logger.info("Starting bot...")
+                await bot.start(token)
+                break
+            except Exception as e:
+                logger.exception(f"Error starting bot: {e}")
+                if not _is_transient_start_error(e):
+                    sys.exit(1)
 
-        # Check if this is a connection-related error
-        if isinstance(
-            e,
-            (
-                TimeoutError,
-                discord_errors.ConnectionClosed,
-                discord_errors.GatewayNotFound,
-                asyncio.exceptions.CancelledError,
-                discord_errors.HTTPException,
-                discord_errors.LoginFailure,
-                client_exceptions.ClientConnectorError,
-                client_exceptions.ClientConnectorDNSError,
-            ),
-        ):
-            error_type = type(e).__name__
-            logger.warning(f"Connection error detected: {error_type}: {e}")
+                # Exits once too many connection failures have occurred
+                handle_connection_error(connection_monitor, e)
 
-            if connection_monitor.connection_failed(error_type):
-                logger.critical("Connection failure threshold reached. Exiting...")
-                logger.critical(connection_monitor.get_status_report())
-        sys.exit(1)
+                delay = min(
+                    START_RETRY_MAX_DELAY, 2**attempt * (1 + random.random() * 0.5)
+                )
+                logger.info("Retrying bot start in %.1f seconds", delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+                # Close what the failed start left open (e.g. its HTTP session,
+                # which the next login would otherwise replace without
+                # closing), then reset the client so it can be started again
+                await bot.close()
+                bot.clear()
+    finally:
+        # Don't lose changes still waiting for the background writer
+        await storage.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    log_listener = start_log_listener()
+    try:
+        # Prefer uvloop's faster event loop where it is available (POSIX only)
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(main())
+        else:
+            uvloop.run(main())
+    finally:
+        # Flush any log records still waiting in the queue
+        log_listener.stop()